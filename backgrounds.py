@@ -0,0 +1,76 @@
+import os
+import hashlib
+from PIL import Image
+
+# ===============================
+# Pre-composited title card backgrounds
+#
+# Resizing the background photo and darkening it with an overlay is the same
+# work for every card, so it is done once per (theme, size) and cached in
+# memory and on disk. Callers get a copy() they are free to draw on.
+# ===============================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, ".cache", "backgrounds")
+
+# theme name -> (background image, RGBA overlay drawn on top)
+THEMES = {
+    "default": (os.path.join(BASE_DIR, "bg_img", "wimg.jpg"), (0, 0, 0, 180)),
+}
+
+_memory_cache = {}
+
+
+def register_theme(name, image_path, overlay=(0, 0, 0, 180)):
+    THEMES[name] = (image_path, overlay)
+
+
+def _source_key(image_path):
+    # mtime is cheap; the content hash catches files replaced with an older mtime
+    stat = os.stat(image_path)
+    with open(image_path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    return f"{stat.st_mtime_ns}_{digest}"
+
+
+def _composite(source, size, overlay):
+    overlay_img = Image.new('RGBA', (size, size), overlay)
+    return Image.alpha_composite(source.convert('RGBA'), overlay_img)
+
+
+def _build_background(theme, size):
+    image_path, overlay = THEMES[theme]
+    try:
+        key = _source_key(image_path)
+    except OSError as e:
+        print(f"Error loading background image: {str(e)}")
+        # Fallback to dark background if the image is missing
+        return _composite(Image.new('RGB', (size, size), (30, 30, 30)), size, overlay)
+
+    overlay_tag = "".join(f"{c:02x}" for c in overlay)
+    cache_path = os.path.join(CACHE_DIR, f"{theme}_{size}_{overlay_tag}_{key}.png")
+    if os.path.exists(cache_path):
+        with Image.open(cache_path) as cached:
+            return cached.convert('RGBA')
+
+    with Image.open(image_path) as source:
+        resized = source.resize((size, size), Image.Resampling.LANCZOS)
+    base = _composite(resized, size, overlay)
+
+    # Fast PNG settings: the artifact is read back often and written once
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    base.save(tmp_path, format="PNG", compress_level=1)
+    os.replace(tmp_path, cache_path)
+    return base
+
+
+def get_background(theme="default", size=1080):
+    if theme not in THEMES:
+        raise KeyError(f"Unknown background theme: {theme}")
+    if (theme, size) not in _memory_cache:
+        _memory_cache[(theme, size)] = _build_background(theme, size)
+    return _memory_cache[(theme, size)].copy()
+
+
+def clear_cache():
+    _memory_cache.clear()
@@ -0,0 +1,164 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import main
+import carousel
+import output_profiles
+import tracing
+
+# ===============================
+# Headless batch renderer for main.process_images
+#
+# Manifest (CSV or JSONL), one post per row/line:
+#   problem_name, difficulty, tags, problem_image, solution_image[, date]
+# Image paths are relative to the manifest file. Tags can be a
+# "DFS, BFS" string or (JSONL only) a list of strings. date (YYYY-MM-DD)
+# is the post date and defaults to today.
+#
+# Post folders are built incrementally, so re-running a manifest only
+# re-renders posts whose screenshots or metadata changed. --bundle zip|tar
+# writes each post as a single archive instead (always a full render).
+#
+#   python batch.py problems.csv --out posts
+#
+# No tkinter is imported anywhere on this path.
+# ===============================
+REQUIRED_FIELDS = ("problem_name", "difficulty", "tags", "problem_image", "solution_image")
+
+
+# ===============================
+# 1️⃣ FUNCTION: Read manifest rows
+# ===============================
+def load_manifest(manifest_path):
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    if manifest_path.lower().endswith(".csv"):
+        with open(manifest_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        with open(manifest_path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    items = []
+    for line_no, row in enumerate(rows, start=1):
+        missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+        if missing:
+            raise ValueError(f"{manifest_path}: item {line_no} is missing {', '.join(missing)}")
+
+        tags = row["tags"]
+        if isinstance(tags, list):
+            tags = ", ".join(tags)
+
+        items.append({
+            "problem_name": row["problem_name"],
+            "difficulty": row["difficulty"],
+            "tags": tags,
+            "problem_image": os.path.join(base_dir, row["problem_image"]),
+            "solution_image": os.path.join(base_dir, row["solution_image"]),
+            "date": date.fromisoformat(row["date"]) if row.get("date") else None,
+        })
+    return items
+
+
+# ===============================
+# 2️⃣ FUNCTION: Render one post (runs in a worker process)
+# ===============================
+def render_item(item, output_root, profile=None, force=False, bundle=None):
+    start = time.perf_counter()
+    folder = main.process_images(
+        [item["problem_image"], item["solution_image"]],
+        problem_name=item["problem_name"],
+        level=item["difficulty"],
+        tags=item["tags"],
+        output_root=output_root,
+        profile=profile,
+        post_date=item["date"],
+        force=force,
+        bundle=bundle,
+    )
+    return folder, time.perf_counter() - start
+
+
+# ===============================
+# 3️⃣ FUNCTION: Render every post on all cores
+# ===============================
+def _render_all(items, output_root, workers, profile, force, bundle):
+    # Yields (item, (folder, seconds), error) as posts finish
+    if workers == 1:
+        # One worker: render in this process (no pool start-up, and --trace sees it)
+        for item in items:
+            try:
+                yield item, render_item(item, output_root, profile, force, bundle), None
+            except Exception as e:
+                yield item, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_item, item, output_root, profile, force, bundle): item for item in items}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
+
+
+def run_batch(items, output_root, workers=None, profile=None, force=False, bundle=None):
+    os.makedirs(output_root, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    results = []
+
+    print(f"🚀 Rendering {len(items)} posts on {workers} workers...")
+    batch_start = time.perf_counter()
+
+    for item, result, error in _render_all(items, output_root, workers, profile, force, bundle):
+        if error is None:
+            folder, elapsed = result
+            results.append({"problem_name": item["problem_name"], "folder": folder,
+                            "seconds": elapsed, "error": None})
+            print(f"✅ {item['problem_name']} → {folder} ({elapsed:.2f}s)")
+        else:
+            results.append({"problem_name": item["problem_name"], "folder": None,
+                            "seconds": None, "error": str(error)})
+            print(f"❌ {item['problem_name']}: {error}")
+
+    total = time.perf_counter() - batch_start
+    failures = [r for r in results if r["error"]]
+    print(f"\n📊 {len(results) - len(failures)}/{len(results)} posts rendered in {total:.2f}s")
+    for failure in failures:
+        print(f"   ⚠️ {failure['problem_name']}: {failure['error']}")
+
+    return results
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Render LeetCode Insta posts from a manifest")
+    parser.add_argument("manifest", help="CSV or JSONL file with problem metadata and screenshot paths")
+    parser.add_argument("--out", default=".", help="Folder to write Leetcode_<date>_<id> post folders into")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--profile", choices=sorted(output_profiles.PROFILES), help="Encoder preset for saved images")
+    parser.add_argument("--force", action="store_true", help="Re-render every output even if it is up to date")
+    parser.add_argument("--bundle", choices=carousel.BUNDLES, help="Write each post as one .zip/.tar instead of a folder")
+    parser.add_argument("--report", help="Optional JSON file for per-item timings and failures")
+    parser.add_argument("--trace", help="Write a Chrome trace to this JSON file (use with --workers 1, "
+                                        "worker processes aren't traced)")
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    results = run_batch(load_manifest(args.manifest), args.out, args.workers, args.profile, args.force, args.bundle)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+import tempfile
+from io import BytesIO
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import output_profiles
+
+# ===============================
+# Benchmark: encode time and bytes per asset for each output profile
+#
+#   python benchmarks/bench_encode.py
+#
+# "write ms" is encode + write to a real file, so disk cost shows up too.
+# ===============================
+REPEAT = 5
+
+
+def make_assets():
+    # Square post slide: white page with dark text-like lines
+    slide = Image.new("RGB", (1080, 1080), (255, 255, 255))
+    draw = ImageDraw.Draw(slide)
+    for y in range(60, 1020, 28):
+        draw.rectangle((60, y, 60 + (y * 37) % 900, y + 12), fill=(40, 40, 40))
+
+    # Title card: photo-like gradient under a translucent overlay, RGBA
+    gradient = Image.linear_gradient("L").resize((1080, 1080))
+    title = Image.merge("RGB", (gradient, gradient.rotate(90), gradient.rotate(180))).convert("RGBA")
+    title = Image.alpha_composite(title, Image.new("RGBA", title.size, (0, 0, 0, 180)))
+    ImageDraw.Draw(title).text((200, 400), "Leetcode Daily Challenge", fill=(255, 255, 255))
+
+    # Stretched crop from a screenshot, saved as PNG
+    crop = slide.crop((0, 0, 900, 500)).resize((900, 900), Image.Resampling.LANCZOS)
+
+    return {
+        "slide.jpg": slide,
+        "title.png": title,
+        "crop.png": crop,
+    }
+
+
+def main_bench():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, image in make_assets().items():
+            for profile in output_profiles.PROFILES:
+                fmt, path = output_profiles.resolve(os.path.join(tmp, name), profile)
+
+                start = time.perf_counter()
+                for _ in range(REPEAT):
+                    buffer = BytesIO()
+                    output_profiles.encode_image(image, buffer, fmt, profile)
+                encode_ms = (time.perf_counter() - start) / REPEAT * 1000
+
+                start = time.perf_counter()
+                for _ in range(REPEAT):
+                    output_profiles.save_image(image, os.path.join(tmp, name), profile)
+                write_ms = (time.perf_counter() - start) / REPEAT * 1000
+
+                rows.append((name, profile, fmt, encode_ms, write_ms, os.path.getsize(path)))
+
+    print(f"{'asset':<12}{'profile':<10}{'format':<8}{'encode ms':>11}{'write ms':>10}{'KB':>9}")
+    for name, profile, fmt, encode_ms, write_ms, size in rows:
+        print(f"{name:<12}{profile:<10}{fmt:<8}{encode_ms:>11.1f}{write_ms:>10.1f}{size / 1024:>9.1f}")
+    return rows
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,97 @@
+import os
+import sys
+import json
+import tempfile
+import argparse
+import subprocess
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import output_profiles
+from crop_selector import CropSelector
+from pixel_buffer import PixelBuffer
+
+# ===============================
+# Benchmark: peak RSS per pasted screenshot, old flow vs PixelBuffer
+#
+#   python benchmarks/bench_paste_memory.py
+#
+# Each flow runs in a fresh process. "peak MB" is how far peak RSS rose
+# above the point where the clipboard image already existed, i.e. the extra
+# memory one paste + opening the crop selector costs.
+# ===============================
+SIZES = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "5K": (5120, 2880),
+}
+SCREEN = (1920, 1080)
+
+
+def max_rss_mb():
+    import resource  # Unix only
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_clipboard_image(size):
+    img = Image.new("RGB", size, (30, 30, 30))
+    draw = ImageDraw.Draw(img)
+    for y in range(20, size[1], 22):
+        draw.rectangle((40, y, 40 + (y * 29) % (size[0] - 80), y + 10), fill=(200, 200, 200))
+    return img
+
+
+def old_flow(holder, tmp):
+    # paste_from_clipboard + take_partial_screenshot before the shared buffer
+    clipboard_image = holder.pop()
+    clipboard_image.save(os.path.join(tmp, "pasted.png"), quality=100, optimize=False)
+    cv_image = cv2.cvtColor(np.array(clipboard_image), cv2.COLOR_RGB2BGR)
+    current_cv_image = cv_image.copy()
+    display_image = cv_image.copy()
+    return clipboard_image, cv_image, current_cv_image, display_image
+
+
+def new_flow(holder, tmp):
+    clipboard_image = holder.pop()
+    pixels = PixelBuffer.from_image(clipboard_image)
+    del clipboard_image  # what paste_from_clipboard does
+    output_profiles.save_image(pixels.image, os.path.join(tmp, "pasted.png"))
+    selector = CropSelector(pixels.rgba, "bench", SCREEN, on_select=print)
+    return pixels, selector
+
+
+FLOWS = {"old": old_flow, "buffer": new_flow}
+
+
+def run_worker(flow, label):
+    # The flow gets the only reference, so it can actually free the clipboard image
+    holder = [make_clipboard_image(SIZES[label])]
+    before = max_rss_mb()
+    with tempfile.TemporaryDirectory() as tmp:
+        kept = FLOWS[flow](holder, tmp)
+    print(json.dumps({"peak_mb": max_rss_mb() - before}))
+    return kept
+
+
+def main_bench():
+    print(f"{'input':<8}{'flow':<8}{'raw frame MB':>14}{'peak MB':>10}")
+    for label, (width, height) in SIZES.items():
+        for flow in FLOWS:
+            out = subprocess.run([sys.executable, __file__, "--worker", flow, label],
+                                 capture_output=True, text=True, check=True)
+            row = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{label:<8}{flow:<8}{width * height * 3 / (1024 * 1024):>14.1f}{row['peak_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--worker", nargs=2, metavar=("FLOW", "SIZE"))
+    args = parser.parse_args()
+    if args.worker:
+        run_worker(*args.worker)
+    else:
+        main_bench()
@@ -0,0 +1,116 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import subprocess
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+import square_fit
+
+# ===============================
+# Benchmark: main.resize_to_square vs the old full-decode version
+#
+#   python benchmarks/bench_resize.py
+#
+# Every (implementation, input) pair runs in its own fresh process so the
+# peak RSS number belongs to that resize alone.
+# ===============================
+SIZES = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "5K": (5120, 2880),
+}
+FORMATS = ("jpg", "png")
+REPEAT = 5
+
+
+# Old implementation, kept here as the baseline
+def resize_to_square_legacy(image_path, size=1080):
+    img = Image.open(image_path)
+    width, height = img.size
+    background = Image.new("RGB", (size, size), (255, 255, 255))
+    ratio = min(size / width, size / height)
+    new_size = (int(width * ratio), int(height * ratio))
+    resized = img.resize(new_size)
+    background.paste(resized, ((size - new_size[0]) // 2, (size - new_size[1]) // 2))
+    return background
+
+
+IMPLEMENTATIONS = {
+    "legacy": resize_to_square_legacy,
+    "current": main.resize_to_square,
+}
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS reports bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+
+def make_screenshot(path, size):
+    # Text-like stripes compress like real screenshots and keep JPEG honest
+    img = Image.new("RGB", size, (255, 255, 255))
+    stripe = Image.new("RGB", (size[0], 4), (40, 40, 40))
+    for y in range(0, size[1], 24):
+        img.paste(stripe, (0, y))
+    if path.endswith(".jpg"):
+        img.save(path, quality=95)
+    else:
+        img.save(path)
+
+
+def run_worker(impl, path):
+    # square_fit imports NumPy/OpenCV lazily; load them in every worker so
+    # peak RSS compares the resizes, not the libraries
+    import numpy  # noqa: F401
+    square_fit._cv2()
+    func = IMPLEMENTATIONS[impl]
+    func(path)  # warm-up, also pulls in codec plugins
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func(path)
+    elapsed = (time.perf_counter() - start) / REPEAT
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_rss_mb()}))
+
+
+def main_bench():
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, size in SIZES.items():
+            for fmt in FORMATS:
+                path = os.path.join(tmp, f"{label}.{fmt}")
+                make_screenshot(path, size)
+                for impl in IMPLEMENTATIONS:
+                    out = subprocess.run(
+                        [sys.executable, __file__, "--worker", impl, path],
+                        capture_output=True, text=True, check=True,
+                    )
+                    row = json.loads(out.stdout.strip().splitlines()[-1])
+                    row.update({"input": f"{label}.{fmt}", "impl": impl})
+                    results.append(row)
+
+    print(f"{'input':<12}{'impl':<8}{'ms/img':>10}{'peak RSS MB':>14}")
+    for row in results:
+        print(f"{row['input']:<12}{row['impl']:<8}{row['seconds'] * 1000:>10.1f}{row['peak_rss_mb']:>14.1f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--worker", nargs=2, metavar=("IMPL", "PATH"))
+    args = parser.parse_args()
+    if args.worker:
+        run_worker(*args.worker)
+    else:
+        main_bench()
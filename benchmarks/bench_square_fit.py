@@ -0,0 +1,94 @@
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageOps
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import square_fit
+
+# ===============================
+# Benchmark + pixel-diff check: square_fit engine vs the Pillow paths
+#
+#   python benchmarks/bench_square_fit.py
+#
+# The Pillow references are what main.resize_to_square ("pad") and
+# ImageResizerApp.resize_image ("stretch") used to do. Exits non-zero when the
+# mean per-channel difference goes past MAX_MEAN_DIFF.
+# ===============================
+SIZES = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "4K": (3840, 2160),
+    "5K": (5120, 2880),
+    "6K": (6144, 3456),
+}
+TARGET = 1080
+REPEAT = 3
+MAX_MEAN_DIFF = 3.0  # out of 255
+
+
+def pillow_pad(image, size):
+    width, height = image.size
+    background = Image.new("RGB", (size, size), (255, 255, 255))
+    ratio = min(size / width, size / height)
+    new_size = (int(width * ratio), int(height * ratio))
+    background.paste(image.resize(new_size), ((size - new_size[0]) // 2, (size - new_size[1]) // 2))
+    return background
+
+
+def pillow_stretch(image, size):
+    return image.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def pillow_crop(image, size):
+    return ImageOps.fit(image, (size, size), Image.Resampling.BICUBIC)
+
+
+REFERENCES = {"pad": pillow_pad, "stretch": pillow_stretch, "crop": pillow_crop}
+
+
+def make_screenshot(size):
+    # Smooth gradient plus code-like text bars, like a dark-mode editor capture
+    gradient = Image.linear_gradient("L").resize(size)
+    img = Image.merge("RGB", (gradient, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT), gradient))
+    draw = ImageDraw.Draw(img)
+    for y in range(40, size[1] - 40, max(12, size[1] // 60)):
+        draw.rectangle((60, y, 60 + (y * 53) % (size[0] - 120), y + max(4, size[1] // 240)), fill=(230, 230, 230))
+    return img
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func(*args)
+    return result, (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main_bench():
+    backend = "OpenCV" if square_fit.has_cv2() else "Pillow fallback"
+    print(f"square_fit backend: {backend}\n")
+    print(f"{'input':<8}{'mode':<9}{'pillow ms':>11}{'engine ms':>11}{'mean diff':>11}{'max diff':>10}")
+
+    failed = False
+    for label, size in SIZES.items():
+        image = make_screenshot(size)
+        pixels = np.asarray(image)
+        for mode, reference in REFERENCES.items():
+            expected, pillow_ms = timed(reference, image, TARGET)
+            actual, engine_ms = timed(square_fit.square_fit, pixels, TARGET, mode)
+
+            diff = np.abs(np.asarray(expected, dtype=np.int16) - actual.astype(np.int16))
+            mean_diff, max_diff = diff.mean(), diff.max()
+            failed |= mean_diff > MAX_MEAN_DIFF
+            print(f"{label:<8}{mode:<9}{pillow_ms:>11.1f}{engine_ms:>11.1f}{mean_diff:>11.2f}{max_diff:>10d}")
+
+    if failed:
+        print(f"\n❌ mean pixel difference above {MAX_MEAN_DIFF}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
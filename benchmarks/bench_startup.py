@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# ===============================
+# Benchmark: cold start of leetcode_daily.main() with and without Chrome
+#
+#   python benchmarks/bench_startup.py
+#
+# Each run is a fresh interpreter, timed from process launch (imports
+# included) to main() returning. "browser" uses SeleniumFetcher, which is
+# what every run used to pay for before the driver became lazy.
+# ===============================
+MODES = ("http", "browser")
+RUNS = 3
+
+
+def max_rss_mb(who):
+    import resource
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_worker(mode):
+    import leetcode_daily
+    from fetchers import SeleniumFetcher
+
+    fetcher = SeleniumFetcher() if mode == "browser" else None
+    leetcode_daily.main(fetcher)
+
+    import resource  # Unix only
+    print(json.dumps({
+        "python_rss_mb": max_rss_mb(resource.RUSAGE_SELF),
+        # Largest reaped descendant, i.e. chromedriver/Chrome in browser mode
+        "child_rss_mb": max_rss_mb(resource.RUSAGE_CHILDREN),
+    }))
+
+
+def main_bench():
+    print(f"{'mode':<10}{'cold start s':>14}{'python RSS MB':>16}{'child RSS MB':>15}")
+    for mode in MODES:
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, __file__, "--worker", mode],
+                capture_output=True, text=True, cwd=ROOT,
+            )
+            elapsed = time.perf_counter() - start
+            if out.returncode != 0:
+                print(f"{mode:<10} failed: {out.stderr.strip().splitlines()[-1:]}")
+                break
+            row = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{mode:<10}{elapsed:>14.2f}{row['python_rss_mb']:>16.1f}{row['child_rss_mb']:>15.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--worker", choices=MODES)
+    args = parser.parse_args()
+    if args.worker:
+        run_worker(args.worker)
+    else:
+        main_bench()
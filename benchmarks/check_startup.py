@@ -0,0 +1,94 @@
+import os
+import sys
+import argparse
+import subprocess
+
+# ===============================
+# Start-up regression check for every entry point
+#
+#   python benchmarks/check_startup.py              # exits 1 if over budget
+#   python benchmarks/check_startup.py --scale 2    # slower machine, looser budgets
+#
+# Each entry module is imported in a fresh interpreter under
+# `python -X importtime`; the best of --runs cumulative import times is
+# compared against its budget. Heavy optional dependencies must not be
+# pulled in at import time at all - they belong in the code paths that use
+# them (cv2 in the crop selector, requests on the first API call, ...).
+# ===============================
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+# module -> import budget in ms (cumulative, measured with -X importtime)
+BUDGETS_MS = {
+    "main": 120,
+    "batch": 130,
+    "watcher": 130,
+    "leetcode_daily": 90,
+    "exporter": 90,
+    "image_resizer": 150,
+}
+
+HEAVY = ("cv2", "numpy", "requests", "bs4", "selenium", "keyboard", "pyperclip")
+# Entry points that run without a display must not load tkinter either
+HEADLESS = ("main", "batch", "watcher", "leetcode_daily", "exporter")
+
+
+def import_profile(module):
+    # Returns (cumulative ms for module, set of every module imported)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    total_us, loaded = None, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        loaded.add(name.strip())
+        if name == " " + module:  # nested imports are indented further
+            total_us = int(cumulative)
+    return total_us / 1000, loaded
+
+
+def check(modules, runs=RUNS, scale=1.0):
+    failures = []
+    print(f"{'entry point':<18}{'import ms':>11}{'budget ms':>11}  heavy modules loaded")
+    for module in modules:
+        profiles = [import_profile(module) for _ in range(runs)]
+        best = min(ms for ms, _ in profiles)
+        budget = BUDGETS_MS[module] * scale
+        forbidden = HEAVY + ("tkinter",) if module in HEADLESS else HEAVY
+        heavy = sorted(name for name in profiles[0][1] if name in forbidden)
+        status = "ok"
+        if best > budget:
+            failures.append(f"{module}: {best:.0f} ms > {budget:.0f} ms budget")
+            status = "over budget"
+        if heavy:
+            failures.append(f"{module}: imports {', '.join(heavy)} at start-up")
+            status = "heavy import"
+        print(f"{module:<18}{best:>11.1f}{budget:>11.0f}  {', '.join(heavy) or '-'}  [{status}]")
+    return failures
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Check entry-point import time against per-module budgets")
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS_MS), help="Entry points to check (default: all)")
+    parser.add_argument("--runs", type=int, default=RUNS, help="Fresh interpreters per entry point (best one counts)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (slow CI boxes)")
+    args = parser.parse_args(argv)
+
+    failures = check(args.modules, args.runs, args.scale)
+    if failures:
+        print("\n❌ Start-up regressions:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("\n✅ Every entry point is within its start-up budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
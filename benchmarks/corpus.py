@@ -0,0 +1,72 @@
+import os
+import random
+
+from PIL import Image, ImageDraw
+
+# ===============================
+# Deterministic synthetic screenshot corpus for the benchmarks
+#
+# Dark "editor" screenshots with code-like rows of coloured blocks: they
+# compress and resample like real LeetCode screenshots, and the same seed
+# always produces byte-identical files, so timings are comparable between
+# runs and machines.
+#
+#   python benchmarks/corpus.py .cache/bench_corpus
+# ===============================
+SIZES = {
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "4K": (3840, 2160),
+    "5K": (5120, 2880),
+    "phone": (1170, 2532),
+}
+FORMATS = ("png", "jpg")
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "bench_corpus")
+
+BACKGROUND = (30, 30, 30)
+TOKEN_COLOURS = [(212, 212, 212), (86, 156, 214), (206, 145, 120), (181, 206, 168), (197, 134, 192)]
+
+
+def make_screenshot(size, seed=0):
+    rng = random.Random(f"{size}-{seed}")
+    width, height = size
+    img = Image.new("RGB", size, BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    line_height = max(12, height // 60)
+    glyph = max(4, line_height // 2)
+
+    for y in range(line_height, height - line_height, line_height):
+        if rng.random() < 0.15:
+            continue  # blank line
+        x = width // 20 + glyph * 4 * rng.randint(0, 4)  # indentation
+        while x < width * 0.9 and rng.random() < 0.85:
+            token = glyph * rng.randint(2, 10)
+            draw.rectangle((x, y, x + token, y + glyph), fill=rng.choice(TOKEN_COLOURS))
+            x += token + glyph
+    return img
+
+
+def build_corpus(folder=DEFAULT_DIR, sizes=SIZES, formats=FORMATS):
+    # Returns {"<size>.<format>": path}; files that already exist are reused
+    os.makedirs(folder, exist_ok=True)
+    corpus = {}
+    for label, size in sizes.items():
+        image = None
+        for fmt in formats:
+            path = os.path.join(folder, f"{label}.{fmt}")
+            if not os.path.exists(path):
+                image = image or make_screenshot(size)
+                tmp_path = f"{path}.tmp"
+                if fmt == "jpg":
+                    image.save(tmp_path, format="JPEG", quality=95)
+                else:
+                    image.save(tmp_path, format="PNG")
+                os.replace(tmp_path, path)
+            corpus[f"{label}.{fmt}"] = path
+    return corpus
+
+
+if __name__ == "__main__":
+    import sys
+    for name, path in build_corpus(*sys.argv[1:2]).items():
+        print(f"{name:<12}{path}")
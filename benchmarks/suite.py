@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import platform
+import tempfile
+import argparse
+import statistics
+import contextlib
+
+import PIL
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import main
+import output_profiles
+from exporter import write_atomic
+from corpus import build_corpus, DEFAULT_DIR
+
+# ===============================
+# Benchmark suite for the image pipeline
+#
+#   python benchmarks/suite.py --save baseline.json       # record a baseline
+#   python benchmarks/suite.py --compare baseline.json    # fail on regressions
+#   python benchmarks/suite.py --filter resize_to_square  # just some cases
+#
+# Every case runs once to warm up, then --repeat times; the fastest run is
+# what gets compared (the least noisy number on a busy machine). --compare exits 1 if any case got more than --threshold
+# (default 15%) slower than the baseline. Baselines are per machine - record
+# one on the box you compare on. Inputs come from the synthetic corpus in
+# benchmarks/corpus.py.
+# ===============================
+REPEAT = 5
+THRESHOLD = 0.15
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "questionOfToday.json")
+
+
+class Skip(Exception):
+    pass
+
+
+def _loaded(path):
+    with Image.open(path) as image:
+        image.load()
+        return image.copy()
+
+
+def case_resize_to_square(path, tmp):
+    return lambda: main.resize_to_square(path)
+
+
+def case_resize_image(path, tmp):
+    # ImageResizerApp.resize_image doesn't touch self, so no window is needed
+    try:
+        from image_resizer import ImageResizerApp
+    except ImportError as e:
+        raise Skip(f"image_resizer not importable: {e}")
+    image = _loaded(path)
+    return lambda: ImageResizerApp.resize_image(None, image)
+
+
+def case_main_title(tmp):
+    out = os.path.join(tmp, "final_title.jpg")
+    return lambda: main.create_title_image(out, main.PROBLEM_NAME, main.DIFFICULTY, main.TAGS)
+
+
+def case_daily_title(tmp):
+    from leetcode_daily import LeetCodeDaily, parse_daily_challenge
+    from fetchers import ReplayFetcher
+
+    leetcode = LeetCodeDaily(ReplayFetcher(FIXTURE), use_cache=False)
+    leetcode.output_dir = tmp
+    with open(FIXTURE, encoding="utf-8") as f:
+        problem_info = parse_daily_challenge(json.load(f))
+
+    def run():
+        if leetcode.create_title_image(problem_info) is None:
+            raise Skip("create_title_image failed (fonts missing?)")
+    return run
+
+
+def case_save(path, profile, fmt, tmp):
+    image = main.resize_to_square(path)
+    out = os.path.join(tmp, f"save_{profile}.{fmt}")
+    return lambda: output_profiles.save_image(image, out, profile)
+
+
+def case_write_atomic(path, profile, fmt, tmp):
+    image = main.resize_to_square(path)
+    out = os.path.join(tmp, f"atomic_{profile}.{fmt}")
+    return lambda: write_atomic(image, out, profile)
+
+
+def collect_cases(corpus):
+    # name -> factory(tmp) returning the callable to time
+    cases = {}
+    for name, path in corpus.items():
+        cases[f"resize_to_square/{name}"] = lambda tmp, path=path: case_resize_to_square(path, tmp)
+        cases[f"resize_image/{name}"] = lambda tmp, path=path: case_resize_image(path, tmp)
+    cases["create_title_image/main"] = case_main_title
+    cases["create_title_image/leetcode_daily"] = case_daily_title
+    # Save paths encode a finished 1080x1080 post image
+    source = corpus["1440p.png"]
+    for profile, settings in output_profiles.PROFILES.items():
+        # Profiles with a fixed format (webp) ignore the requested extension
+        for fmt in ("jpg", "png") if "format" not in settings else ("jpg",):
+            cases[f"save_image/{profile}.{fmt}"] = lambda tmp, p=profile, f=fmt: case_save(source, p, f, tmp)
+    cases["write_atomic/default.jpg"] = lambda tmp: case_write_atomic(source, "default", "jpg", tmp)
+    return cases
+
+
+def time_case(func, repeat):
+    func()  # warm-up: codec plugins, font registry, background cache
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return {"median": statistics.median(runs), "min": min(runs), "runs": repeat}
+
+
+def run_suite(repeat=REPEAT, name_filter=None, corpus_dir=DEFAULT_DIR):
+    corpus = build_corpus(corpus_dir)
+    results, skipped = {}, {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, factory in collect_cases(corpus).items():
+            if name_filter and name_filter not in name:
+                continue
+            try:
+                # The pipeline prints progress; keep the report readable
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                    results[name] = time_case(factory(tmp), repeat)
+            except Skip as e:
+                skipped[name] = str(e)
+            print(f"{name:<44}{results[name]['min'] * 1000:>10.2f} ms" if name in results
+                  else f"{name:<44}{'skipped':>13}  ({skipped[name]})")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "repeat": repeat,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(current, baseline, threshold=THRESHOLD):
+    # Returns the names of cases that got slower than threshold allows
+    regressions = []
+    print(f"\n{'case':<44}{'baseline ms':>13}{'now ms':>10}{'change':>9}")
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<44}{'-':>13}{now['min'] * 1000:>10.2f}{'new':>9}")
+            continue
+        change = now["min"] / before["min"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  ⚠️ slower"
+        print(f"{name:<44}{before['min'] * 1000:>13.2f}{now['min'] * 1000:>10.2f}{change:>+9.0%}{flag}")
+    return regressions
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the image pipeline on a synthetic screenshot corpus")
+    parser.add_argument("--save", help="Write results as a JSON baseline to this file")
+    parser.add_argument("--compare", help="Baseline JSON to compare against; exits 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Allowed slowdown before failing (0.15 = 15%%)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Timed runs per case")
+    parser.add_argument("--filter", help="Only run cases whose name contains this")
+    parser.add_argument("--corpus", default=DEFAULT_DIR, help="Folder for the generated screenshots")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.repeat, args.filter, args.corpus)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nBaseline written to: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} case(s) more than {args.threshold:.0%} slower: {', '.join(regressions)}")
+            return 1
+        print(f"\n✅ No case more than {args.threshold:.0%} slower than the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
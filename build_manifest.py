@@ -0,0 +1,76 @@
+import os
+import json
+import hashlib
+
+# ===============================
+# Incremental build manifest for a post folder
+#
+# Each Leetcode_<date>_<id> folder keeps a .build.json recording, per output,
+# the content hashes of its input files plus the render parameters. An output
+# is rebuilt only when that fingerprint changes or the file is gone (like make).
+# Bump RENDER_VERSION whenever the drawing code changes what it produces.
+# ===============================
+MANIFEST_NAME = ".build.json"
+RENDER_VERSION = 3
+
+
+def file_digest(path, chunk_size=1 << 20):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class BuildManifest:
+    def __init__(self, folder):
+        self.path = os.path.join(folder, MANIFEST_NAME)
+        self.folder = folder
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("render_version") != RENDER_VERSION:
+            data = {"render_version": RENDER_VERSION, "outputs": {}, "inputs": {}}
+        self.outputs = data["outputs"]
+        # path -> [size, mtime_ns, sha256]; lets unchanged inputs skip re-hashing
+        self.input_stats = data["inputs"]
+
+    def _input_hash(self, path):
+        stat = os.stat(path)
+        known = self.input_stats.get(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = file_digest(path)
+        self.input_stats[path] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def fingerprint(self, inputs, params):
+        sha = hashlib.sha256()
+        for path in inputs:
+            sha.update(self._input_hash(os.path.abspath(path)).encode())
+        sha.update(json.dumps(params, sort_keys=True).encode())
+        return sha.hexdigest()
+
+    def is_fresh(self, name, fingerprint):
+        entry = self.outputs.get(name)
+        return bool(entry and entry["fingerprint"] == fingerprint
+                    and os.path.exists(os.path.join(self.folder, entry["file"])))
+
+    def record(self, name, fingerprint, output_path):
+        # A profile switch can change the extension; drop the superseded file
+        previous = self.outputs.get(name)
+        if previous and previous["file"] != os.path.basename(output_path):
+            try:
+                os.remove(os.path.join(self.folder, previous["file"]))
+            except OSError:
+                pass
+        self.outputs[name] = {"fingerprint": fingerprint, "file": os.path.basename(output_path)}
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"render_version": RENDER_VERSION, "outputs": self.outputs,
+                       "inputs": self.input_stats}, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,176 @@
+import sys
+import json
+import time
+import asyncio
+import argparse
+from datetime import date, timedelta
+
+import aiohttp
+
+from fetchers import GRAPHQL_URL
+from leetcode_daily import parse_question
+
+# ===============================
+# Async bulk problem-metadata fetcher for backfilling old posts
+#
+#   python bulk_fetch.py --slugs two-sum lru-cache --out problems.jsonl
+#   python bulk_fetch.py --from 2025-01-01 --to 2025-03-31 --out problems.jsonl
+#
+# All queries share one aiohttp session (one keep-alive connection pool),
+# with a cap on in-flight requests and a requests-per-second limit so a
+# 500-problem backfill stays polite to the API.
+# ===============================
+QUESTION_QUERY = """
+query questionData($titleSlug: String!) {
+    question(titleSlug: $titleSlug) {
+        questionFrontendId
+        title
+        titleSlug
+        difficulty
+        topicTags {
+            name
+        }
+    }
+}
+"""
+
+# One request per month covers every daily challenge in it
+DAILY_MONTH_QUERY = """
+query dailyCodingQuestionRecords($year: Int!, $month: Int!) {
+    dailyCodingChallengeV2(year: $year, month: $month) {
+        challenges {
+            date
+            question {
+                questionFrontendId
+                title
+                titleSlug
+                difficulty
+                topicTags {
+                    name
+                }
+            }
+        }
+    }
+}
+"""
+
+
+class RateLimiter:
+    # Spaces request starts at least 1/rate seconds apart
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_start > now:
+                await asyncio.sleep(self._next_start - now)
+            self._next_start = max(now, self._next_start) + self.interval
+
+
+class BulkFetcher:
+    def __init__(self, url=GRAPHQL_URL, concurrency=8, rate=10, retries=3, timeout=15):
+        self.url = url
+        self.concurrency = concurrency
+        self.rate = rate
+        self.retries = retries
+        self.timeout = timeout
+
+    async def _post(self, session, semaphore, limiter, query, variables):
+        for attempt in range(1, self.retries + 1):
+            async with semaphore:
+                await limiter.wait()
+                try:
+                    async with session.post(self.url, json={"query": query, "variables": variables}) as response:
+                        if response.status != 429 and response.status < 500:
+                            response.raise_for_status()
+                            return await response.json()
+                        error = f"HTTP {response.status}"
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = str(e) or type(e).__name__
+            if attempt == self.retries:
+                raise RuntimeError(f"GraphQL request failed after {self.retries} attempts: {error}")
+            await asyncio.sleep(2 ** (attempt - 1))
+
+    async def _run(self, jobs):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = RateLimiter(self.rate)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        headers = {"Content-Type": "application/json"}
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            tasks = [self._post(session, semaphore, limiter, query, variables) for query, variables in jobs]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def fetch_slugs(self, slugs):
+        # slug -> problem_info (or None when the request failed / slug is unknown)
+        responses = asyncio.run(self._run([(QUESTION_QUERY, {"titleSlug": slug}) for slug in slugs]))
+        results = {}
+        for slug, data in zip(slugs, responses):
+            if isinstance(data, Exception):
+                print(f"❌ {slug}: {data}")
+                results[slug] = None
+                continue
+            question = (data.get("data") or {}).get("question")
+            results[slug] = parse_question(question) if question else None
+        return results
+
+    def fetch_date_range(self, start, end):
+        # "YYYY-MM-DD" -> problem_info for every daily challenge in [start, end]
+        months = []
+        day = start.replace(day=1)
+        while day <= end:
+            months.append((day.year, day.month))
+            day = (day + timedelta(days=32)).replace(day=1)
+
+        responses = asyncio.run(self._run([(DAILY_MONTH_QUERY, {"year": y, "month": m}) for y, m in months]))
+        results = {}
+        for (year, month), data in zip(months, responses):
+            if isinstance(data, Exception):
+                print(f"❌ {year}-{month:02d}: {data}")
+                continue
+            records = ((data.get("data") or {}).get("dailyCodingChallengeV2") or {}).get("challenges", [])
+            for record in records:
+                if start.isoformat() <= record["date"] <= end.isoformat():
+                    results[record["date"]] = parse_question(record["question"])
+        return dict(sorted(results.items()))
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch metadata for many LeetCode problems at once")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--slugs", nargs="+", help="Problem title slugs, e.g. two-sum")
+    group.add_argument("--from", dest="start", type=date.fromisoformat, help="First daily challenge date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, default=date.today(), help="Last daily challenge date")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=10, help="Max requests per second")
+    parser.add_argument("--out", help="JSONL output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    fetcher = BulkFetcher(concurrency=args.concurrency, rate=args.rate)
+    start = time.perf_counter()
+    if args.slugs:
+        results = fetcher.fetch_slugs(args.slugs)
+    else:
+        results = fetcher.fetch_date_range(args.start, args.end)
+    elapsed = time.perf_counter() - start
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for key, problem_info in results.items():
+            if problem_info:
+                out.write(json.dumps({"key": key, **problem_info}) + "\n")
+    finally:
+        if args.out:
+            out.close()
+
+    found = sum(1 for info in results.values() if info)
+    print(f"📊 {found}/{len(results)} problems fetched in {elapsed:.2f}s", file=sys.stderr)
+    return 0 if found == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,169 @@
+import os
+import json
+import sqlite3
+from datetime import date
+from functools import lru_cache
+from string import Formatter
+
+# ===============================
+# Caption engine for description.txt
+#
+# templates/caption.txt is parsed once into literal/field segments, so
+# rendering a caption is a single join. Per-problem "Approach" notes and the
+# tag -> hashtag table live in data/approaches.json (edit that file) and are
+# compiled into an indexed SQLite store in .cache/captions.sqlite, rebuilt
+# whenever the JSON changes. Hashtags are looked up in a dict built once per
+# process; problems without notes simply get no Approach section.
+#
+#   engine = CaptionEngine()
+#   engine.render("1123. Lowest Common Ancestor...", "Medium", "DFS, BFS", date(2025, 4, 4))
+# ===============================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_PATH = os.path.join(BASE_DIR, "templates", "caption.txt")
+SEED_PATH = os.path.join(BASE_DIR, "data", "approaches.json")
+DB_PATH = os.path.join(BASE_DIR, ".cache", "captions.sqlite")
+STORE_VERSION = 2
+
+
+class CaptionTemplate:
+    def __init__(self, text):
+        # [(literal, field name or None)], parsed once
+        self.segments = [(literal, field) for literal, field, _, _ in Formatter().parse(text)]
+        self.fields = {field for _, field in self.segments if field}
+
+    def render(self, values):
+        return "".join(literal + values[field] if field else literal for literal, field in self.segments)
+
+
+@lru_cache(maxsize=None)
+def load_template(path=TEMPLATE_PATH):
+    with open(path, encoding="utf-8") as f:
+        return CaptionTemplate(f.read().rstrip("\n"))
+
+
+def _seed_stamp(seed_path):
+    stat = os.stat(seed_path)
+    return f"{STORE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def build_store(seed_path=SEED_PATH, db_path=DB_PATH):
+    # Compile the JSON seed into a fresh database, then swap it in atomically
+    with open(seed_path, encoding="utf-8") as f:
+        seed = json.load(f)
+
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    tmp_path = f"{db_path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+    db = sqlite3.connect(tmp_path)
+    try:
+        db.executescript("""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE approaches (frontend_id TEXT PRIMARY KEY, steps TEXT NOT NULL);
+            CREATE TABLE hashtags (tag TEXT PRIMARY KEY, hashtag TEXT NOT NULL);
+        """)
+        db.execute("INSERT INTO meta VALUES ('seed', ?)", (_seed_stamp(seed_path),))
+        db.execute("INSERT INTO meta VALUES ('base_hashtags', ?)", (json.dumps(seed.get("base_hashtags", [])),))
+        for frontend_id, entry in seed.get("approaches", {}).items():
+            db.execute("INSERT INTO approaches VALUES (?, ?)", (frontend_id, json.dumps(entry["steps"])))
+        db.executemany("INSERT INTO hashtags VALUES (?, ?)",
+                       [(normalize_tag(tag), hashtag) for tag, hashtag in seed.get("hashtags", {}).items()])
+        db.commit()
+    finally:
+        db.close()
+    os.replace(tmp_path, db_path)
+
+
+def normalize_tag(tag):
+    return tag.strip().lower()
+
+
+class ApproachStore:
+    def __init__(self, db_path=DB_PATH, seed_path=SEED_PATH):
+        self.db = self._open(db_path, seed_path)
+
+    @staticmethod
+    def _open(db_path, seed_path):
+        try:
+            db = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            row = db.execute("SELECT value FROM meta WHERE key = 'seed'").fetchone()
+            if row and row[0] == _seed_stamp(seed_path):
+                return db
+            db.close()
+        except sqlite3.Error:
+            pass
+        build_store(seed_path, db_path)
+        return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+    def approach(self, frontend_id):
+        row = self.db.execute("SELECT steps FROM approaches WHERE frontend_id = ?", (str(frontend_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def hashtags(self):
+        return dict(self.db.execute("SELECT tag, hashtag FROM hashtags"))
+
+    def base_hashtags(self):
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'base_hashtags'").fetchone()
+        return json.loads(row[0]) if row else []
+
+    def close(self):
+        self.db.close()
+
+
+class CaptionEngine:
+    def __init__(self, store=None, template=None):
+        self.store = store or ApproachStore()
+        self.template = template or load_template()
+        # Precomputed lookups: tag -> hashtag, filled in for unknown tags on first sight
+        self.tag_hashtags = self.store.hashtags()
+        self.base_hashtags = self.store.base_hashtags()
+        self._approach_blocks = {}
+        self._dates = {}
+
+    def hashtag(self, tag):
+        key = normalize_tag(tag)
+        hashtag = self.tag_hashtags.get(key)
+        if hashtag is None:
+            hashtag = self.tag_hashtags[key] = "#" + "".join(char for char in key if char.isalnum())
+        return hashtag
+
+    def _approach_block(self, frontend_id):
+        block = self._approach_blocks.get(frontend_id)
+        if block is None:
+            steps = self.store.approach(frontend_id)
+            block = ""
+            if steps:
+                lines = "\n".join(f"{number}. {step}" for number, step in enumerate(steps, start=1))
+                block = f"\n📌 Approach:\n{lines}\n"
+            self._approach_blocks[frontend_id] = block
+        return block
+
+    def render(self, problem_name, level, tags, on_date):
+        tag_list = [tag.strip() for tag in tags.split(",")] if isinstance(tags, str) else list(tags)
+        hashtags = dict.fromkeys(self.base_hashtags)
+        hashtags.update(dict.fromkeys(self.hashtag(tag) for tag in tag_list if tag))
+
+        date_text = self._dates.get(on_date)
+        if date_text is None:
+            date_text = self._dates[on_date] = on_date.isoformat()
+
+        return self.template.render({
+            "date": date_text,
+            "problem": problem_name,
+            "difficulty": level,
+            "tags": tags if isinstance(tags, str) else ", ".join(tag_list),
+            "approach": self._approach_block(problem_name.split(".")[0].strip()),
+            "hashtags": " ".join(hashtags),
+        })
+
+
+@lru_cache(maxsize=None)
+def default_engine():
+    # One engine per process (batch workers each get their own)
+    return CaptionEngine()
+
+
+if __name__ == "__main__":
+    import sys
+    engine = default_engine()
+    print(engine.render(sys.argv[1], sys.argv[2], sys.argv[3], date.today()))
@@ -0,0 +1,123 @@
+import os
+import io
+import time
+import queue
+import tarfile
+import zipfile
+import threading
+
+import output_profiles
+from tracing import span
+
+# ===============================
+# In-memory carousel pipeline for one post
+#
+# Every asset (title card, problem and solution slides, caption) is built in
+# memory. Slides go through a small bounded queue to an encoder thread, so
+# slide N+1 is rendered while slide N is being encoded (Pillow drops the GIL
+# for both). Nothing touches the disk until flush, which writes every file
+# at once - into the post folder, or as a single .zip/.tar bundle.
+#
+#   files = render_assets([("final_title", build_title), ...], profile)
+#   flush(files, folder)                 # -> {name: path}
+#   flush(files, folder, bundle="zip")   # -> {name: "<folder>.zip"}
+# ===============================
+BUNDLES = ("zip", "tar")
+QUEUE_SIZE = 2
+
+
+def encode_asset(name, content, profile=None):
+    # content: a PIL image (extension follows the profile) or caption text
+    if isinstance(content, str):
+        return name + ".txt", content.encode("utf-8")
+    fmt, filename = output_profiles.resolve(name + ".jpg", profile)
+    buffer = io.BytesIO()
+    with span("encode", format=fmt, asset=name):
+        output_profiles.encode_image(content, buffer, fmt, profile)
+    return filename, buffer.getvalue()
+
+
+def render_assets(assets, profile=None, queue_size=QUEUE_SIZE):
+    # assets: [(name, build)] where build() returns a PIL image or a str.
+    # Returns {name: (filename, bytes)} in asset order
+    pending = queue.Queue(maxsize=queue_size)
+    encoded = {}
+    errors = []
+
+    def encoder():
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            name, content = item
+            try:
+                encoded[name] = encode_asset(name, content, profile)
+            except Exception as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=encoder, name="carousel-encoder", daemon=True)
+    thread.start()
+    try:
+        for name, build in assets:
+            if errors:
+                break
+            with span("render", asset=name):
+                content = build()
+            # Blocks while the encoder is queue_size slides behind: memory stays bounded
+            pending.put((name, content))
+    finally:
+        pending.put(None)
+        thread.join()
+    if errors:
+        raise errors[0]
+    return {name: encoded[name] for name, _ in assets}
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _bundle_bytes(files, bundle):
+    buffer = io.BytesIO()
+    if bundle == "zip":
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for filename, data in files.values():
+                # Images are already compressed; only the caption is worth deflating
+                compression = zipfile.ZIP_DEFLATED if filename.endswith(".txt") else zipfile.ZIP_STORED
+                archive.writestr(filename, data, compress_type=compression)
+    else:
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            now = time.time()
+            for filename, data in files.values():
+                info = tarfile.TarInfo(filename)
+                info.size, info.mtime = len(data), now
+                archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def flush(files, folder, bundle=None):
+    # Writes every encoded asset in one go; returns {name: path written}
+    if bundle is not None:
+        if bundle not in BUNDLES:
+            raise ValueError(f"Unknown bundle type: {bundle}")
+        path = f"{folder}.{bundle}"
+        data = _bundle_bytes(files, bundle)
+        with span("disk_write", path=path):
+            _write_atomic(path, data)
+        return {name: path for name in files}
+
+    os.makedirs(folder, exist_ok=True)
+    written = {}
+    with span("disk_write", path=folder, files=len(files)):
+        for name, (filename, data) in files.items():
+            written[name] = os.path.join(folder, filename)
+            _write_atomic(written[name], data)
+    return written
@@ -0,0 +1,65 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from exporter import write_atomic
+from recipes import ResizeRecipe
+
+# ===============================
+# Batch queue for partial-screenshot crops
+#
+# The crop selector only records rectangles here; cropping, stretching and
+# encoding happen on a background pool, so dragging never waits on an encode.
+# Rectangles that nearly coincide with one already queued (IoU above
+# `overlap`) are dropped as duplicates. flush() waits for the pipeline when
+# the selector closes.
+# ===============================
+
+
+def overlap_ratio(a, b):
+    # Intersection over union of two (x1, y1, x2, y2) boxes
+    ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+    ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+    intersection = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - intersection
+    return intersection / union if union else 0.0
+
+
+class CropQueue:
+    def __init__(self, source, output_dir, profile=None, overlap=0.9, workers=2):
+        self.source = source
+        self.output_dir = output_dir
+        self.profile = profile
+        self.overlap = overlap
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        # (box, recipe, future) in the order the crops were made
+        self.entries = []
+
+    def submit(self, box):
+        # Returns False when the box is a near-duplicate of one already queued
+        if any(overlap_ratio(box, queued_box) >= self.overlap for queued_box, _, _ in self.entries):
+            return False
+
+        recipe = ResizeRecipe(self.source, crop_box=box)
+        # Sequence number keeps rapid-fire crops within one second apart
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.output_dir, f"cropped_{timestamp}_{len(self.entries) + 1}.png")
+        future = self.executor.submit(self._encode, recipe, path)
+        self.entries.append((box, recipe, future))
+        return True
+
+    def _encode(self, recipe, path):
+        # Full-resolution crop + stretch exists only while it is being written
+        written_path, _ = write_atomic(recipe.render(), path, self.profile)
+        return written_path
+
+    def flush(self):
+        # Wait for every queued crop; returns [(recipe, path or None, error or None)]
+        results = []
+        for _, recipe, future in self.entries:
+            try:
+                results.append((recipe, future.result(), None))
+            except Exception as e:
+                results.append((recipe, None, e))
+        self.executor.shutdown()
+        return results
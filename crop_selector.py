@@ -0,0 +1,124 @@
+import cv2
+import numpy as np
+from PIL import Image
+
+# ===============================
+# Event-driven crop selector for partial screenshots
+#
+# The window shows a downscaled display proxy of the screenshot (never the
+# full 5K frame). Dragging redraws only the strips under the old and new
+# rubber-band outline instead of copying the whole frame, and selections are
+# mapped back to source pixel coordinates before on_select is called.
+# The loop blocks inside cv2.waitKey, so an idle selector uses no CPU.
+# ===============================
+RUBBER_BAND = (0, 255, 0)   # BGR, rectangle being dragged
+COMMITTED = (0, 0, 255)     # BGR, rectangles already cropped
+THICKNESS = 2
+ESC = 27
+
+
+class CropSelector:
+    def __init__(self, source, window_name, display_size, on_select, min_size=10):
+        # source: PIL image or HxWx3 RGB / HxWx4 RGBA array (e.g. PixelBuffer.rgba);
+        # display_size: (width, height) of the screen
+        self.window_name = window_name
+        self.on_select = on_select
+        self.min_size = min_size
+        self.selections = []
+
+        if isinstance(source, Image.Image):
+            self.source_size = source.size
+        else:
+            self.source_size = (source.shape[1], source.shape[0])
+        width, height = self.source_size
+        self.scale = min(1.0, display_size[0] / width, display_size[1] / height)
+        proxy_size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+
+        # Downscale first, convert to BGR second: colour conversion only touches the proxy
+        if isinstance(source, Image.Image):
+            small = source if self.scale == 1.0 else source.resize(proxy_size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            proxy = np.asarray(small.convert("RGB"))
+        else:
+            proxy = source if self.scale == 1.0 else cv2.resize(source, proxy_size, interpolation=cv2.INTER_AREA)
+        conversion = cv2.COLOR_RGBA2BGR if proxy.shape[2] == 4 else cv2.COLOR_RGB2BGR
+        # base = proxy + committed rectangles; frame = base + current rubber band
+        self.base = cv2.cvtColor(proxy, conversion)
+        self.frame = self.base.copy()
+
+        self.anchor = None
+        self.rubber_band = None
+
+    def to_source(self, x, y):
+        width, height = self.source_size
+        return (min(width, max(0, round(x / self.scale))),
+                min(height, max(0, round(y / self.scale))))
+
+    def _restore_outline(self, rect):
+        # Copy back just the four edge strips the outline was drawn over
+        x1, y1, x2, y2 = rect
+        pad = THICKNESS
+        h, w = self.frame.shape[:2]
+        strips = (
+            (y1 - pad, y1 + pad + 1, x1 - pad, x2 + pad + 1),
+            (y2 - pad, y2 + pad + 1, x1 - pad, x2 + pad + 1),
+            (y1 - pad, y2 + pad + 1, x1 - pad, x1 + pad + 1),
+            (y1 - pad, y2 + pad + 1, x2 - pad, x2 + pad + 1),
+        )
+        for top, bottom, left, right in strips:
+            top, bottom = max(0, top), min(h, bottom)
+            left, right = max(0, left), min(w, right)
+            if top < bottom and left < right:
+                self.frame[top:bottom, left:right] = self.base[top:bottom, left:right]
+
+    def _normalized(self, x, y):
+        ax, ay = self.anchor
+        return min(ax, x), min(ay, y), max(ax, x), max(ay, y)
+
+    def _on_mouse(self, event, x, y, flags, param):
+        if event == cv2.EVENT_LBUTTONDOWN:
+            self.anchor = (x, y)
+            self.rubber_band = None
+        elif event == cv2.EVENT_MOUSEMOVE and self.anchor is not None:
+            if self.rubber_band is not None:
+                self._restore_outline(self.rubber_band)
+            self.rubber_band = self._normalized(x, y)
+            cv2.rectangle(self.frame, self.rubber_band[:2], self.rubber_band[2:], RUBBER_BAND, THICKNESS)
+            cv2.imshow(self.window_name, self.frame)
+        elif event == cv2.EVENT_LBUTTONUP and self.anchor is not None:
+            if self.rubber_band is not None:
+                self._restore_outline(self.rubber_band)
+            rect = self._normalized(x, y)
+            self.anchor = self.rubber_band = None
+
+            x1, y1 = self.to_source(*rect[:2])
+            x2, y2 = self.to_source(*rect[2:])
+            # Minimum size is checked in source pixels, like before
+            if x2 - x1 > self.min_size and y2 - y1 > self.min_size:
+                cv2.rectangle(self.base, rect[:2], rect[2:], COMMITTED, THICKNESS)
+                cv2.rectangle(self.frame, rect[:2], rect[2:], COMMITTED, THICKNESS)
+                box = (x1, y1, x2, y2)
+                self.selections.append(box)
+                self.on_select(box)
+            cv2.imshow(self.window_name, self.frame)
+
+    def _window_open(self):
+        try:
+            return cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) >= 1
+        except cv2.error:
+            return False
+
+    def run(self):
+        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        cv2.setWindowProperty(self.window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+        cv2.setMouseCallback(self.window_name, self._on_mouse)
+        cv2.imshow(self.window_name, self.frame)
+
+        try:
+            # waitKey sleeps in the GUI event loop and dispatches mouse events;
+            # the timeout only exists to notice the window being closed
+            while self._window_open():
+                if cv2.waitKey(250) & 0xFF == ESC:
+                    break
+        finally:
+            cv2.destroyWindow(self.window_name)
+        return self.selections
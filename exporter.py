@@ -0,0 +1,121 @@
+import os
+import sys
+import time
+import threading
+import argparse
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import output_profiles
+from recipes import ResizeRecipe
+from tracing import span
+
+# ===============================
+# Parallel exporter for resized images
+#
+# Each job is (recipe, output path). Workers render the full-resolution
+# square, encode it into a temp file next to the target and rename it into
+# place, so a crash never leaves half-written images behind. Pillow drops the
+# GIL while resampling/encoding, so a thread pool scales across cores.
+#
+# Headless use (also handy for benchmarking):
+#   python exporter.py shots/*.png --out exported --workers 8
+# ===============================
+
+
+class ExportStats:
+    def __init__(self):
+        self.images = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.failures = []  # (output path, error message)
+
+    @property
+    def images_per_second(self):
+        return self.images / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_second(self):
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds else 0.0
+
+    def summary(self):
+        return (f"{self.images} images, {self.bytes / (1024 * 1024):.1f} MB in {self.seconds:.2f}s "
+                f"({self.images_per_second:.1f} images/s, {self.mb_per_second:.1f} MB/s)")
+
+
+def write_atomic(image, output_path, profile=None):
+    fmt, output_path = output_profiles.resolve(output_path, profile)
+    # Same folder as the target so the rename is atomic; unique per thread
+    tmp_path = f"{output_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    buffer = BytesIO()
+    with span("encode", format=fmt):
+        output_profiles.encode_image(image, buffer, fmt, profile)
+    try:
+        with span("disk_write", path=output_path):
+            with open(tmp_path, "wb") as f:
+                f.write(buffer.getbuffer())
+            os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return output_path, os.path.getsize(output_path)
+
+
+def _export_one(recipe, output_path, profile, cancel):
+    if cancel is not None and cancel.is_set():
+        return output_path, 0
+    # The full-size render lives only for the duration of this call
+    return write_atomic(recipe.render(), output_path, profile)
+
+
+def export_recipes(jobs, workers=None, profile=None, on_progress=None, cancel=None):
+    # on_progress(done, total, output_path, error) is called from worker
+    # threads; GUI callers must hand it over to their own thread
+    stats = ExportStats()
+    total = len(jobs)
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 2) as pool:
+        futures = {pool.submit(_export_one, recipe, path, profile, cancel): path for recipe, path in jobs}
+        for done, future in enumerate(as_completed(futures), start=1):
+            error = None
+            try:
+                written_path, size = future.result()
+                if size:
+                    stats.images += 1
+                    stats.bytes += size
+            except Exception as e:
+                written_path, error = futures[future], str(e)
+                stats.failures.append((written_path, error))
+            if on_progress:
+                on_progress(done, total, written_path, error)
+
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Stretch images to 1:1 and export them in parallel")
+    parser.add_argument("images", nargs="+")
+    parser.add_argument("--out", required=True, help="Output folder")
+    parser.add_argument("--workers", type=int, default=None, help="Worker threads (default: all cores)")
+    parser.add_argument("--profile", choices=sorted(output_profiles.PROFILES), help="Encoder preset")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    jobs = []
+    for path in args.images:
+        name, ext = os.path.splitext(os.path.basename(path))
+        jobs.append((ResizeRecipe(path), os.path.join(args.out, f"{name}_resized{ext}")))
+
+    def report(done, total, path, error):
+        print(f"[{done}/{total}] {'❌ ' + error if error else '✅'} {path}")
+
+    stats = export_recipes(jobs, args.workers, args.profile, report)
+    print(f"📊 {stats.summary()}")
+    return 1 if stats.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
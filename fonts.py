@@ -0,0 +1,44 @@
+import os
+from functools import lru_cache
+from PIL import ImageFont
+
+# ===============================
+# Process-wide font registry
+#
+# Fonts are parsed once per (path, size) and fallback chains are resolved
+# once per process, so rendering many title cards never re-reads TTF files.
+# ===============================
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+
+# Fallback chains used by the title cards, best choice first
+TITLE_FONTS = (
+    os.path.join(FONTS_DIR, "MontserratAlternates-Bold.ttf"),
+    os.path.join(FONTS_DIR, "BebasNeue-Regular.ttf"),
+    "arial.ttf",
+)
+TEXT_FONTS = (
+    os.path.join(FONTS_DIR, "Poppins-Regular.ttf"),
+    os.path.join(FONTS_DIR, "Lato-Regular.ttf"),
+    "arial.ttf",
+)
+EMOJI_FONTS = (
+    "C:\\Windows\\Fonts\\seguiemj.ttf",
+)
+
+@lru_cache(maxsize=None)
+def get_font(path, size):
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=None)
+def resolve_font(candidates, size):
+    # Walk the fallback chain once; later calls hit the cache
+    for index, path in enumerate(candidates):
+        try:
+            font = get_font(path, size)
+        except OSError:
+            continue
+        if index > 0:
+            print(f"Could not load preferred fonts, using {os.path.basename(path)}")
+        return font
+    raise OSError(f"None of the fonts could be loaded: {', '.join(candidates)}")
@@ -1,13 +1,22 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk, ImageGrab
+from tkinter import filedialog, messagebox, ttk
+from PIL import Image, ImageGrab
 import os
-import keyboard
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
-import pyperclip
-from io import BytesIO
-import cv2
-import numpy as np
+import output_profiles
+from square_fit import square_fit_image
+from preview_list import PreviewList, THUMB_SIZE
+from recipes import ResizeRecipe
+from exporter import export_recipes
+from crop_queue import CropQueue
+from tracing import span
+
+# keyboard, NumPy and OpenCV are imported where they're first needed (hotkey
+# setup, the dedupe index on the worker pool, the crop selector), so the
+# window opens without them
 
 class ImageResizerApp:
     def __init__(self, root):
@@ -23,18 +32,41 @@ class ImageResizerApp:
             os.makedirs(self.output_dir)
         
         # Variables
-        self.original_images = []
+        # resized_images holds ResizeRecipes: full resolution is only built on download
         self.resized_images = []
         self.image_paths = []
         self.screenshot_shortcut = "ctrl+shift+s"  # Full screenshot shortcut
         self.partial_screenshot_shortcut = "ctrl+shift+a"  # Partial screenshot shortcut
         self.current_full_screenshot = None
-        self.current_cv_image = None
+        self.current_pixels = None
+        # Pasted screenshots are also written to output_dir (off the Tk thread)
+        self.save_pastes = True
+        # Encoder settings for saved crops, see output_profiles.py
+        self.output_profile = output_profiles.DEFAULT_PROFILE
+        
+        # Decoding/resizing runs on this pool; finished pairs come back through
+        # upload_queue and are turned into PhotoImages on the Tk thread
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+        self.upload_queue = queue.Queue()
+        self.upload_cancel = threading.Event()
+        self.upload_futures = []
+        self.upload_total = 0
+        self.upload_done = 0
+        self.upload_polling = False
+        self.export_queue = queue.Queue()
+        self.export_running = False
+        # Pasted screenshots being written by the pool: (path, hash, error) come back here
+        self.paste_queue = queue.Queue()
+        self.paste_saves = 0
+        # Perceptual hashes of everything in output_dir; the first sync hashes
+        # the whole folder, so it runs on the pool while the window opens
+        self.phash_index = self.executor.submit(self.open_phash_index)
         
         # Create GUI elements
         self.create_widgets()
         
         # Set up keyboard shortcuts
+        import keyboard
         keyboard.add_hotkey(self.screenshot_shortcut, self.take_screenshot)
         keyboard.add_hotkey(self.partial_screenshot_shortcut, self.take_partial_screenshot)
         
@@ -64,6 +96,17 @@ class ImageResizerApp:
         self.download_btn.pack(side=tk.LEFT, padx=5)
         self.download_btn.config(state=tk.DISABLED)
         
+        # Cancel button (only active while an upload is running)
+        self.cancel_btn = tk.Button(top_frame, text="Cancel", command=self.cancel_upload)
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+        self.cancel_btn.config(state=tk.DISABLED)
+        
+        # Upload progress
+        self.progress = ttk.Progressbar(top_frame, length=200, mode="determinate")
+        self.progress.pack(side=tk.LEFT, padx=5)
+        self.progress_label = tk.Label(top_frame, text="")
+        self.progress_label.pack(side=tk.LEFT, padx=5)
+        
         # Shortcut info label
         shortcuts_frame = tk.Frame(top_frame)
         shortcuts_frame.pack(side=tk.RIGHT, padx=5)
@@ -74,21 +117,9 @@ class ImageResizerApp:
         partial_shortcut_label = tk.Label(shortcuts_frame, text=f"Partial Screenshot: {self.partial_screenshot_shortcut.upper()}")
         partial_shortcut_label.pack()
         
-        # Create canvas and scrollbar for multiple images
-        self.canvas = tk.Canvas(main_frame)
-        self.scrollbar = tk.Scrollbar(main_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Virtualized list of image rows: only rows on screen hold PhotoImages
+        self.preview_list = PreviewList(main_frame)
+        self.preview_list.pack(fill=tk.BOTH, expand=True)
         
     def upload_images(self):
         file_paths = filedialog.askopenfilenames(
@@ -96,87 +127,163 @@ class ImageResizerApp:
         )
         
         if file_paths:
-            self.image_paths = file_paths
-            self.original_images = []
+            self.cancel_upload()
+            self.image_paths = []
             self.resized_images = []
             
             # Clear previous images
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
+            self.preview_list.clear()
             
-            # Process each image
-            for file_path in file_paths:
-                original_image = Image.open(file_path)
-                self.original_images.append(original_image)
-                
-                # Create frame for each image pair
-                image_pair_frame = tk.Frame(self.scrollable_frame)
-                image_pair_frame.pack(pady=10)
-                
-                # Original image label
-                original_label = tk.Label(image_pair_frame, text="Original")
-                original_label.pack(side=tk.LEFT, padx=10)
-                
-                # Resized image label
-                resized_label = tk.Label(image_pair_frame, text="Resized (1:1)")
-                resized_label.pack(side=tk.LEFT, padx=10)
+            # Decode + resize every file on the worker pool; pairs show up as they finish
+            self.upload_cancel = threading.Event()
+            self.upload_total = len(file_paths)
+            self.upload_done = 0
+            self.upload_futures = [
+                self.executor.submit(self.load_image_pair, file_path, self.upload_cancel)
+                for file_path in file_paths
+            ]
+            self.progress.config(maximum=self.upload_total, value=0)
+            self.progress_label.config(text=f"Loading 0/{self.upload_total}")
+            self.cancel_btn.config(state=tk.NORMAL)
+            if not self.upload_polling:
+                self.upload_polling = True
+                self.root.after(50, self.poll_upload_queue)
+    
+    def load_image_pair(self, file_path, cancel):
+        # Runs on a worker thread: no Tk calls in here
+        if cancel.is_set():
+            return
+        try:
+            # Only a preview-sized decode happens here; the file is the recipe's source
+            recipe = ResizeRecipe(file_path)
+            original_thumb, resized_thumb = recipe.previews(THUMB_SIZE)
+            result = (file_path, recipe, original_thumb, resized_thumb, None)
+        except Exception as e:
+            result = (file_path, None, None, None, e)
+        if not cancel.is_set():
+            self.upload_queue.put((cancel, result))
+    
+    def poll_upload_queue(self):
+        # Tk thread: build widgets/PhotoImages for every pair that is ready
+        while True:
+            try:
+                cancel, result = self.upload_queue.get_nowait()
+            except queue.Empty:
+                break
+            if cancel is not self.upload_cancel or cancel.is_set():
+                continue  # left over from a cancelled upload
+            
+            file_path, recipe, original_thumb, resized_thumb, error = result
+            self.upload_done += 1
+            if error is not None:
+                print(f"Failed to load {file_path}: {error}")
+            else:
+                self.image_paths.append(file_path)
+                self.resized_images.append(recipe)
                 
-                # Display original image
-                self.display_image(original_image, original_label)
+                # Thumbnails were made on the worker; the list only builds PhotoImages
+                self.add_image_row(recipe, (original_thumb, resized_thumb))
                 
-                # Resize and display
-                resized_image = self.resize_image(original_image)
-                self.resized_images.append(resized_image)
-                self.display_image(resized_image, resized_label)
+                # Enable download button
+                self.download_btn.config(state=tk.NORMAL)
             
-            # Enable download button
-            self.download_btn.config(state=tk.NORMAL)
+            self.progress.config(value=self.upload_done)
+            self.progress_label.config(text=f"Loading {self.upload_done}/{self.upload_total}")
+        
+        if self.upload_done < self.upload_total and not self.upload_cancel.is_set():
+            self.root.after(50, self.poll_upload_queue)
+        else:
+            self.upload_polling = False
+            if self.upload_total:
+                self.finish_upload()
     
+    def cancel_upload(self):
+        self.upload_cancel.set()
+        for future in self.upload_futures:
+            future.cancel()
+        self.upload_futures = []
+        if self.upload_total:
+            self.finish_upload()
+    
+    def finish_upload(self):
+        if self.upload_cancel.is_set():
+            self.progress_label.config(text=f"Cancelled ({self.upload_done}/{self.upload_total} loaded)")
+        else:
+            self.progress_label.config(text=f"Loaded {self.upload_done} images")
+        self.upload_total = 0
+        self.cancel_btn.config(state=tk.DISABLED)
+    
+    @span("resize")
     def resize_image(self, image):
         # Get the maximum dimension for the square
         max_dim = max(image.size)
-        # Stretch the image to square dimensions
-        return image.resize((max_dim, max_dim), Image.Resampling.LANCZOS)
+        # Stretch the image to square dimensions (shared engine with main.resize_to_square)
+        return square_fit_image(image, max_dim, mode="stretch")
     
-    def display_image(self, image, label):
-        # Get screen dimensions
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        
-        # Calculate display size based on screen size
-        if label.master.winfo_parent() == self.scrollable_frame.winfo_id():  # If it's a pasted image
-            # For pasted images, use the original image size
-            display_size = image.size
-        else:
-            display_size = (600, 600)  # Smaller size for partial screenshots
-        
-        display_image = image.copy()
-        # Only resize if the image is larger than screen
-        if display_size[0] > screen_width or display_size[1] > screen_height:
-            display_image.thumbnail((screen_width, screen_height), Image.Resampling.LANCZOS)
-        
-        # Convert to PhotoImage
-        photo = ImageTk.PhotoImage(display_image)
-        
-        # Update label
-        label.config(image=photo)
-        label.image = photo
+    def add_image_row(self, recipe, thumbnails=None):
+        # One "Original | Resized (1:1)" row; previews are rebuilt at preview
+        # resolution from the recipe whenever the row scrolls back into view
+        self.preview_list.add_row(
+            ["Original", "Resized (1:1)"],
+            [lambda: recipe.source_preview(THUMB_SIZE), lambda: recipe.preview(THUMB_SIZE)],
+            thumbnails,
+        )
     
     def download_images(self):
-        if self.resized_images:
+        if self.resized_images and not self.export_running:
+            jobs = []
+            for recipe, path in zip(self.resized_images, self.image_paths):
+                # Create new filename with _resized suffix
+                filename = os.path.basename(path)
+                name, ext = os.path.splitext(filename)
+                jobs.append((recipe, os.path.join(self.output_dir, f"{name}_resized{ext}")))
+            
+            # Encode + write on the exporter's pool; progress comes back through export_queue
+            self.export_running = True
+            self.download_btn.config(state=tk.DISABLED)
+            self.progress.config(maximum=len(jobs), value=0)
+            self.progress_label.config(text=f"Saving 0/{len(jobs)}")
+            threading.Thread(target=self.run_export, args=(jobs,), daemon=True).start()
+            self.root.after(50, self.poll_export_queue)
+    
+    def run_export(self, jobs):
+        # Background thread: no Tk calls in here
+        try:
+            stats = export_recipes(
+                jobs,
+                profile=self.output_profile,
+                on_progress=lambda *progress: self.export_queue.put(("progress", progress)),
+            )
+            self.export_queue.put(("done", stats))
+        except Exception as e:
+            self.export_queue.put(("error", e))
+    
+    def poll_export_queue(self):
+        while True:
             try:
-                for i, (image, path) in enumerate(zip(self.resized_images, self.image_paths)):
-                    # Create new filename with _resized suffix
-                    filename = os.path.basename(path)
-                    name, ext = os.path.splitext(filename)
-                    new_path = os.path.join(self.output_dir, f"{name}_resized{ext}")
-                    
-                    # Save the image
-                    image.save(new_path)
-                
-                messagebox.showinfo("Success", f"{len(self.resized_images)} images saved successfully in the 'resized_images' folder!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save images: {str(e)}")
+                kind, payload = self.export_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self.poll_export_queue)
+                return
+            
+            if kind == "progress":
+                done, total, path, error = payload
+                self.progress.config(value=done)
+                self.progress_label.config(text=f"Saving {done}/{total}: {os.path.basename(path)}")
+                continue
+            
+            self.export_running = False
+            self.download_btn.config(state=tk.NORMAL)
+            if kind == "error":
+                messagebox.showerror("Error", f"Failed to save images: {str(payload)}")
+            elif payload.failures:
+                self.progress_label.config(text=payload.summary())
+                failed = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in payload.failures)
+                messagebox.showerror("Error", f"Failed to save {len(payload.failures)} images:\n{failed}")
+            else:
+                self.progress_label.config(text=payload.summary())
+                messagebox.showinfo("Success", f"{payload.images} images saved successfully in {self.output_dir}!\n{payload.summary()}")
+            return
 
     def take_screenshot(self):
         # Minimize the window to take screenshot
@@ -184,19 +291,28 @@ class ImageResizerApp:
         time.sleep(0.5)  # Give time for window to minimize
         
         # Take screenshot
-        screenshot = ImageGrab.grab()
+        with span("capture", source="screen"):
+            screenshot = ImageGrab.grab()
         
         # Show the window again
         self.root.deiconify()
         
-        # Save the screenshot
+        # Same screen as one already in output_dir: keep the capture in the
+        # list, but don't write a second copy to disk
         timestamp = time.strftime("%Y%m%d_%H%M%S")
-        screenshot_path = os.path.join(self.output_dir, f"screenshot_{timestamp}.png")
-        screenshot.save(screenshot_path)
-        
-        # Add the screenshot to the list of images
-        self.image_paths.append(screenshot_path)
-        self.original_images.append(screenshot)
+        screenshot_name = f"screenshot_{timestamp}.png"
+        screenshot_path = os.path.join(self.output_dir, screenshot_name)
+        duplicate, value = self.find_duplicate(screenshot)
+        if duplicate:
+            self.progress_label.config(text=f"⚠️ Same screen as {duplicate}, not saved again (still added below)")
+        else:
+            try:
+                with span("encode", format="PNG"):
+                    screenshot.save(screenshot_path)
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to save {screenshot_name}: {e}")
+            else:
+                self.register_saved(screenshot_name, value)
         
         # Process and display the screenshot
         self.process_new_image(screenshot, screenshot_path)
@@ -204,26 +320,53 @@ class ImageResizerApp:
         # Enable download button
         self.download_btn.config(state=tk.NORMAL)
         
+    def open_phash_index(self):
+        # Runs on the worker pool (NumPy is imported there too)
+        from phash_index import PerceptualIndex
+        return PerceptualIndex(self.output_dir)
+
+    @span("dedupe")
+    def find_duplicate(self, image):
+        # Returns (near-identical file already in output_dir or None, hash);
+        # pass the hash to register_saved once the image is on disk
+        from phash_index import dhash
+        index = self.phash_index.result()  # normally done long before the first capture
+        value = dhash(image)
+        return index.find(value), value
+
+    def register_saved(self, name, value):
+        index = self.phash_index.result()
+        index.add(name, value)
+        index.save()
+
+    def save_paste(self, image, path, value, profile):
+        # Runs on a worker thread: no Tk calls in here
+        try:
+            self.paste_queue.put((output_profiles.save_image(image, path, profile), value, None))
+        except Exception as e:
+            self.paste_queue.put((path, value, e))
+
+    def poll_paste_queue(self):
+        # Tk thread: index pasted screenshots once they're written, report failures
+        while True:
+            try:
+                path, value, error = self.paste_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.paste_saves -= 1
+            if error is None:
+                self.register_saved(os.path.basename(path), value)
+            else:
+                self.progress_label.config(text=f"⚠️ Pasted screenshot not saved: {error}")
+                messagebox.showerror("Error", f"Failed to save {os.path.basename(path)}: {error}")
+        if self.paste_saves:
+            self.root.after(50, self.poll_paste_queue)
+
     def process_new_image(self, image, path):
-        # Create frame for the image pair
-        image_pair_frame = tk.Frame(self.scrollable_frame)
-        image_pair_frame.pack(pady=20)
-        
-        # Original image label
-        original_label = tk.Label(image_pair_frame, text="Original")
-        original_label.pack(side=tk.LEFT, padx=20)
-        
-        # Resized image label
-        resized_label = tk.Label(image_pair_frame, text="Resized (1:1)")
-        resized_label.pack(side=tk.LEFT, padx=20)
-        
-        # Display original image
-        self.display_image(image, original_label)
-        
-        # Resize and display
-        resized_image = self.resize_image(image)
-        self.resized_images.append(resized_image)
-        self.display_image(resized_image, resized_label)
+        # Keep a recipe, not a resized copy; previews are made at preview size
+        recipe = ResizeRecipe(image)
+        self.resized_images.append(recipe)
+        self.add_image_row(recipe)
         
         # Add to paths list
         self.image_paths.append(path)
@@ -233,117 +376,75 @@ class ImageResizerApp:
             messagebox.showwarning("Warning", "Please paste a full screenshot first!")
             return
 
-        # Create window and set mouse callback
+        from crop_selector import CropSelector  # OpenCV loads here, on first use
+        
+        # The selector draws on a screen-sized proxy and hands back source-pixel
+        # boxes; the crop queue crops, stretches and saves them in the background
         window_name = "Select Area (Click and drag to select, Release to crop, ESC when done)"
-        cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
-        cv2.setWindowProperty(window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
-        
-        # Convert PIL image to OpenCV format with high quality
-        cv_image = cv2.cvtColor(np.array(self.current_full_screenshot), cv2.COLOR_RGB2BGR)
-        self.current_cv_image = cv_image.copy()
-        self.display_image = cv_image.copy()
-        
-        # Initialize rectangle drawing variables
-        self.drawing = False
-        self.ix, self.iy = -1, -1
-        
-        def draw_rectangle(event, x, y, flags, param):
-            if event == cv2.EVENT_LBUTTONDOWN:
-                self.drawing = True
-                self.ix, self.iy = x, y
-            elif event == cv2.EVENT_MOUSEMOVE:
-                if self.drawing:
-                    self.display_image = self.current_cv_image.copy()
-                    cv2.rectangle(self.display_image, (self.ix, self.iy), (x, y), (0, 255, 0), 2)
-                    cv2.imshow(window_name, self.display_image)
-            elif event == cv2.EVENT_LBUTTONUP:
-                self.drawing = False
-                if abs(x - self.ix) > 10 and abs(y - self.iy) > 10:  # Ensure minimum selection size
-                    # Get coordinates
-                    x1, y1 = min(self.ix, x), min(self.iy, y)
-                    x2, y2 = max(self.ix, x), max(self.iy, y)
-                    
-                    # Draw the final rectangle
-                    cv2.rectangle(self.current_cv_image, (x1, y1), (x2, y2), (0, 0, 255), 2)
-                    self.display_image = self.current_cv_image.copy()
-                    cv2.imshow(window_name, self.display_image)
-                    
-                    # Crop directly from the original PIL image for best quality
-                    cropped_image = self.current_full_screenshot.crop((x1, y1, x2, y2))
-                    
-                    # Stretch to 1:1 ratio
-                    max_dim = max(cropped_image.size)
-                    stretched_image = cropped_image.resize((max_dim, max_dim), Image.Resampling.LANCZOS)
-                    
-                    # Save the stretched image
-                    timestamp = time.strftime("%Y%m%d_%H%M%S")
-                    cropped_path = os.path.join(self.output_dir, f"cropped_{timestamp}.png")
-                    stretched_image.save(cropped_path, quality=100, optimize=False)
-                    
-                    # Add to lists and display
-                    self.original_images.append(cropped_image)
-                    self.resized_images.append(stretched_image)
-                    self.image_paths.append(cropped_path)
-                    
-                    # Display both original and stretched versions
-                    self.display_cropped_images(cropped_image, stretched_image)
-
-        cv2.setMouseCallback(window_name, draw_rectangle)
-        cv2.imshow(window_name, self.current_cv_image)
+        crop_queue = CropQueue(self.current_full_screenshot, self.output_dir, self.output_profile)
+        selector = CropSelector(
+            self.current_pixels.rgba,
+            window_name,
+            display_size=(self.root.winfo_screenwidth(), self.root.winfo_screenheight()),
+            on_select=crop_queue.submit,
+        )
+        selector.run()
         
-        while True:
-            key = cv2.waitKey(1) & 0xFF
-            if key == 27:  # ESC key to finish
-                break
+        # Selector closed: wait for the pending encodes, then list every crop
+        for recipe, cropped_path, error in crop_queue.flush():
+            if error is not None:
+                print(f"Failed to save crop: {error}")
+                continue
+            self.resized_images.append(recipe)
+            self.image_paths.append(cropped_path)
+            self.display_cropped_images(recipe)
         
-        cv2.destroyAllWindows()
         messagebox.showinfo("Complete", "Finished cropping. Press Ctrl+Shift+A again for more crops.")
 
-    def display_cropped_images(self, original, stretched):
-        # Create frame for the image pair
-        image_pair_frame = tk.Frame(self.scrollable_frame)
-        image_pair_frame.pack(pady=20)
-        
-        # Original image label
-        original_label = tk.Label(image_pair_frame, text="Original")
-        original_label.pack(side=tk.LEFT, padx=20)
-        
-        # Resized image label
-        resized_label = tk.Label(image_pair_frame, text="Resized (1:1)")
-        resized_label.pack(side=tk.LEFT, padx=20)
-        
-        # Display original image
-        self.display_image(original, original_label)
-        
-        # Display stretched image
-        self.display_image(stretched, resized_label)
+    def display_cropped_images(self, recipe):
+        # Display both original and stretched versions
+        self.add_image_row(recipe)
         
         # Enable download button
         self.download_btn.config(state=tk.NORMAL)
 
     def paste_from_clipboard(self):
+        from pixel_buffer import PixelBuffer
         try:
             # Get image from clipboard
-            clipboard_image = ImageGrab.grabclipboard()
-            if clipboard_image:
-                # Save the image temporarily with high quality
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                temp_path = os.path.join(self.output_dir, f"pasted_{timestamp}.png")
-                clipboard_image.save(temp_path, quality=100, optimize=False)
+            with span("capture", source="clipboard"):
+                clipboard_image = ImageGrab.grabclipboard()
+            if isinstance(clipboard_image, Image.Image):
+                # Move the pixels into one canonical buffer and drop the clipboard
+                # copy; Pillow, NumPy and OpenCV all work on views of it
+                with span("decode", source="clipboard"):
+                    self.current_pixels = PixelBuffer.from_image(clipboard_image)
+                del clipboard_image
                 
-                # Store the full screenshot
-                self.current_full_screenshot = clipboard_image
+                # Store the full screenshot (zero-copy, read-only Pillow view)
+                self.current_full_screenshot = self.current_pixels.image
                 
-                # Create frame for the pasted image
-                image_frame = tk.Frame(self.scrollable_frame)
-                image_frame.pack(pady=20)
-                
-                # Original image label
-                original_label = tk.Label(image_frame, text="Pasted Screenshot")
-                original_label.pack()
+                # Keep a copy on disk in the background (optional, see save_pastes),
+                # unless the same screenshot is already there
+                caption = "Pasted Screenshot"
+                if self.save_pastes:
+                    timestamp = time.strftime("%Y%m%d_%H%M%S")
+                    # The profile picks the extension (e.g. .webp); index the file under that name
+                    _, temp_path = output_profiles.resolve(os.path.join(self.output_dir, f"pasted_{timestamp}.png"),
+                                                           self.output_profile)
+                    duplicate, value = self.find_duplicate(self.current_full_screenshot)
+                    if duplicate:
+                        caption = f"Pasted Screenshot (same as {duplicate}, not saved again)"
+                    else:
+                        self.executor.submit(self.save_paste, self.current_full_screenshot, temp_path, value,
+                                             self.output_profile)
+                        self.paste_saves += 1
+                        if self.paste_saves == 1:
+                            self.root.after(50, self.poll_paste_queue)
                 
-                # Display original image without resizing
-                self.display_image(clipboard_image, original_label)
+                # Show the pasted screenshot as its own row
+                screenshot = self.current_full_screenshot
+                self.preview_list.add_row([caption], [lambda: screenshot])
                 
                 self.download_btn.config(state=tk.NORMAL)
                 # messagebox.showinfo("Success", "Image pasted successfully!\nClick and drag to select area, release to crop automatically")
@@ -353,16 +454,15 @@ class ImageResizerApp:
             messagebox.showerror("Error", f"Failed to paste image: {str(e)}")
 
     def reset_application(self):
-        # Clear all images and reset state
-        self.original_images = []
+        # Stop any upload still running, then clear all images and reset state
+        self.cancel_upload()
         self.resized_images = []
         self.image_paths = []
         self.current_full_screenshot = None
-        self.current_cv_image = None
+        self.current_pixels = None
         
         # Clear the display
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self.preview_list.clear()
         
         # Reset button states
         self.download_btn.config(state=tk.DISABLED)
@@ -1,7 +1,13 @@
 import os
 from datetime import date
-from tkinter import Tk, filedialog, Label, Button
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
+import output_profiles
+from square_fit import square_fit_image
+import title_layout
+from build_manifest import BuildManifest
+import carousel
+import captions
+from tracing import span
 
 # ===============================
 # 1️⃣ CONFIGURATION - You can edit this
@@ -14,98 +20,112 @@ TAGS = "DFS, BFS"
 # 2️⃣ FUNCTION: Resize any image to square (for Insta)
 # ===============================
 def resize_to_square(image_path, size=1080):
-    img = Image.open(image_path)
-    width, height = img.size
-    background = Image.new("RGB", (size, size), (255, 255, 255))  # white bg
+    with span("decode", path=image_path):
+        img = Image.open(image_path)
+        width, height = img.size
 
-    # Maintain aspect ratio
-    ratio = min(size / width, size / height)
-    new_size = (int(width * ratio), int(height * ratio))
-    resized = img.resize(new_size)
-    background.paste(resized, ((size - new_size[0]) // 2, (size - new_size[1]) // 2))
+        # Maintain aspect ratio
+        ratio = min(size / width, size / height)
+        new_size = (int(width * ratio), int(height * ratio))
 
-    return background
+        # Fast path for big screenshots: JPEG can decode straight at 1/2, 1/4 or 1/8
+        # scale (draft), so we never decode every pixel of a 5K image
+        if ratio < 1:
+            img.draft(img.mode, new_size)
+        img.load()
+
+    # Letterbox onto a white square (area-averaged when shrinking). RGB
+    # conversion happens on the small result, not the full-size frame
+    with span("resize", size=size):
+        squared = square_fit_image(img, size, mode="pad", background=(255, 255, 255))
+    return squared if squared.mode == "RGB" else squared.convert("RGB")
 
 # ===============================
 # 3️⃣ FUNCTION: Create title image
 # ===============================
-def create_title_image(output_path, problem_name, level, tags):
-    img = Image.new("RGB", (1080, 1080), (30, 30, 30))  # dark background
-    draw = ImageDraw.Draw(img)
-
-    # Use system font (Windows/macOS), fallback if not found
-    try:
-        font_big = ImageFont.truetype("arialbd.ttf", 70)
-        font_small = ImageFont.truetype("arial.ttf", 40)
-    except:
-        font_big = ImageFont.load_default()
-        font_small = ImageFont.load_default()
-
-    today = date.today().strftime("%d/%m/%Y")
-
-    draw.text((80, 100), "Leetcode Daily Challenge ⭐", font=font_big, fill="white")
-    draw.text((80, 230), f"{today}", font=font_small, fill="white")
-    draw.text((80, 300), f"{problem_name}", font=font_small, fill="white")
-    draw.text((80, 370), f"Difficulty : {level}", font=font_small, fill="white")
-    draw.text((80, 440), f"Tags : {tags}", font=font_small, fill="white")
+def render_title_image(problem_name, level, tags, on_date=None, template=title_layout.POST_TEMPLATE):
+    # Boxes, fonts and sizes live in templates/post_title.json
+    values = title_layout.card_values(problem_name, level, tags, on_date or date.today())
+    return title_layout.render_card(template, values)
 
-    img.save(output_path)
+def create_title_image(output_path, problem_name, level, tags, profile=None, on_date=None,
+                       template=title_layout.POST_TEMPLATE):
+    img = render_title_image(problem_name, level, tags, on_date, template)
+    return output_profiles.save_image(img, output_path, profile)
 
 # ===============================
 # 4️⃣ FUNCTION: Auto-generate caption/description
 # ===============================
-def generate_description(problem_name, level, tags):
-    today = date.today().strftime("%Y-%m-%d")
-    return (
-        f"✨ Leetcode Daily Challenge - {today}\n"
-        f"🔹 Problem: {problem_name}\n"
-        f"🧠 Difficulty: {level}\n"
-        f"🏷️ Tags: {tags}\n"
-        "\n📌 Approach:\n"
-        "1. Traverse tree to find the deepest level\n"
-        "2. Backtrack to find common ancestor of deepest leaves\n"
-        "3. Used DFS to calculate depth\n"
-        "\n#leetcode #dsa #interviewprep #python #ai #coding"
-    )
+def generate_description(problem_name, level, tags, on_date=None):
+    # Template in templates/caption.txt; approach notes and hashtags per
+    # problem/tag come from data/approaches.json (see captions.py)
+    return captions.default_engine().render(problem_name, level, tags, on_date or date.today())
 
 # ===============================
 # 5️⃣ FUNCTION: Main processor - puts everything together
 # ===============================
-def process_images(image_paths):
+@span("process_images")
+def process_images(image_paths, problem_name=PROBLEM_NAME, level=DIFFICULTY, tags=TAGS, output_root=".",
+                   profile=None, post_date=None, force=False, bundle=None):
+    # bundle="zip"/"tar" writes the whole post as one <folder>.zip/.tar
+    # (always a full render) instead of the incremental post folder
     print("\n🔁 Processing images...")
+    post_date = post_date or date.today()
+
+    folder_name = os.path.join(output_root, f"Leetcode_{post_date}_{problem_name.split('.')[0]}")
+
+    # Every output is (name, input files, render params, builder); builders
+    # return an in-memory image or text and only run when .build.json says
+    # the output is stale (or force=True / bundle)
+    profile_name = profile or output_profiles.DEFAULT_PROFILE
+    metadata = {"problem_name": problem_name, "level": level, "tags": tags, "date": str(post_date)}
+    outputs = [
+        ("final_title", [title_layout.template_path(title_layout.POST_TEMPLATE)], dict(metadata, profile=profile_name),
+         lambda: render_title_image(problem_name, level, tags, post_date)),
+        ("final_problem", [image_paths[0]], {"size": 1080, "profile": profile_name},
+         lambda: resize_to_square(image_paths[0])),
+        ("final_solution", [image_paths[1]], {"size": 1080, "profile": profile_name},
+         lambda: resize_to_square(image_paths[1])),
+        ("description", [captions.TEMPLATE_PATH, captions.SEED_PATH], metadata,
+         lambda: generate_description(problem_name, level, tags, post_date)),
+    ]
+
+    if bundle:
+        files = carousel.render_assets([(name, build) for name, _, _, build in outputs], profile)
+        path = carousel.flush(files, folder_name, bundle)["description"]
+        print(f"✅ Done! Post bundled in → {path}")
+        return path
 
-    # Resize input images
-    problem_image = resize_to_square(image_paths[0])
-    solution_image = resize_to_square(image_paths[1])
-
-    # Create output folder
-    folder_name = f"Leetcode_{date.today()}_{PROBLEM_NAME.split('.')[0]}"
     os.makedirs(folder_name, exist_ok=True)
-
-    # Save images
-    problem_image.save(os.path.join(folder_name, "final_problem.jpg"))
-    solution_image.save(os.path.join(folder_name, "final_solution.jpg"))
-
-    # Create and save title image
-    create_title_image(
-        output_path=os.path.join(folder_name, "final_title.jpg"),
-        problem_name=PROBLEM_NAME,
-        level=DIFFICULTY,
-        tags=TAGS
-    )
-
-    # Create and save description text
-    description = generate_description(PROBLEM_NAME, DIFFICULTY, TAGS)
-    with open(os.path.join(folder_name, "description.txt"), "w") as f:
-        f.write(description)
-
-    print(f"✅ Done! Assets saved in → {folder_name}")
-    print("📁 Files: title, problem, solution, description")
+    manifest = BuildManifest(folder_name)
+    stale = {}
+    for name, inputs, params, build in outputs:
+        fingerprint = manifest.fingerprint(inputs, params)
+        if force or not manifest.is_fresh(name, fingerprint):
+            stale[name] = (fingerprint, build)
+
+    # Render and encode overlap in memory; everything is written in one flush
+    files = carousel.render_assets([(name, build) for name, (_, build) in stale.items()], profile)
+    written = carousel.flush(files, folder_name)
+    for name, (fingerprint, _) in stale.items():
+        manifest.record(name, fingerprint, written[name])
+    manifest.save()
+
+    rebuilt = list(stale)
+    if rebuilt:
+        print(f"✅ Done! Assets saved in → {folder_name}")
+        print(f"📁 Rebuilt: {', '.join(rebuilt)}")
+    else:
+        print(f"⏭️ Up to date, nothing to rebuild in → {folder_name}")
+    return folder_name
 
 # ===============================
 # 6️⃣ FUNCTION: GUI - Upload Image Files
 # ===============================
 def select_images():
+    # tkinter is imported here so headless runs (batch.py) never load it
+    from tkinter import filedialog
+
     files = filedialog.askopenfilenames(
         title="Select Problem & Solution Screenshots",
         filetypes=[("Image Files", "*.jpg *.png *.jpeg")]
@@ -119,6 +139,8 @@ def select_images():
 # 7️⃣ FUNCTION: Run the GUI App
 # ===============================
 def main_gui():
+    from tkinter import Tk, Label, Button
+
     root = Tk()
     root.title("LeetCode Insta Post Generator")
     root.geometry("400x200")
@@ -0,0 +1,88 @@
+import os
+from io import BytesIO
+
+from tracing import span
+
+# ===============================
+# Output profiles shared by every place we save an image
+#
+#   "default" - Pillow defaults (what we always did)
+#   "fast"    - cheapest encode: low zlib level, no optimize passes
+#   "small"   - smallest upload: progressive JPEG with optimized Huffman
+#               tables, max PNG compression
+#   "webp"    - like "small" but negotiates the output to WebP
+#
+# Pick one per call, or set INSTABOT_OUTPUT_PROFILE for the whole run.
+#
+# The requested extension decides the format unless the profile forces one
+# ("webp"). Other formats Pillow can write (.gif, .bmp, .tif, ...) keep their
+# extension and are saved with Pillow's defaults; unknown extensions become
+# PNG.
+# ===============================
+PROFILES = {
+    "default": {
+        "JPEG": {},
+        "PNG": {},
+    },
+    "fast": {
+        "JPEG": {"quality": 90, "optimize": False, "progressive": False},
+        "PNG": {"compress_level": 1, "optimize": False},
+    },
+    "small": {
+        "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+        "PNG": {"compress_level": 9, "optimize": True},
+    },
+    "webp": {
+        "format": "WEBP",
+        "WEBP": {"quality": 85, "method": 4},
+    },
+}
+
+DEFAULT_PROFILE = os.environ.get("INSTABOT_OUTPUT_PROFILE", "default")
+
+EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+FORMATS_BY_EXTENSION = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP"}
+
+
+def _pillow_format(ext):
+    # Format Pillow writes for an extension the profiles don't list, or None
+    from PIL import Image
+    fmt = Image.registered_extensions().get(ext)
+    return fmt if fmt in Image.SAVE else None
+
+
+def resolve(path, profile=None):
+    # Returns (format, final path) for a requested output path
+    settings = PROFILES[profile or DEFAULT_PROFILE]
+    name, ext = os.path.splitext(path)
+    ext = ext.lower()
+    fmt = settings.get("format") or FORMATS_BY_EXTENSION.get(ext)
+    if fmt is None:
+        fmt = _pillow_format(ext)
+        if fmt is not None:
+            return fmt, path  # e.g. .gif/.bmp: keep the source format
+        fmt = "PNG"
+    if FORMATS_BY_EXTENSION.get(ext) != fmt:
+        path = name + EXTENSIONS[fmt]
+    return fmt, path
+
+
+def encode_image(image, fp, fmt, profile=None):
+    options = PROFILES[profile or DEFAULT_PROFILE].get(fmt, {})
+    # JPEG has no alpha channel
+    if fmt == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    image.save(fp, format=fmt, **options)
+
+
+def save_image(image, path, profile=None):
+    # Returns the path actually written (the extension follows the profile's format).
+    # Encoding goes to memory first, so a failed encode never leaves a partial file
+    fmt, path = resolve(path, profile)
+    buffer = BytesIO()
+    with span("encode", format=fmt):
+        encode_image(image, buffer, fmt, profile)
+    with span("disk_write", path=path):
+        with open(path, "wb") as f:
+            f.write(buffer.getbuffer())
+    return path
@@ -0,0 +1,140 @@
+import os
+import json
+import numpy as np
+from PIL import Image
+
+# ===============================
+# Persistent perceptual-hash index of the screenshots in a folder
+#
+# Every image gets a 256-bit dHash (17x16 grayscale, compare neighbours).
+# LeetCode screenshots share most of their pixels (same UI, same layout), so
+# a 64-bit hash puts different problems within 1-3 bits of each other; at
+# 256 bits they stay 9+ bits apart while re-captures of one screen differ by
+# 0-3. The hash is split into eight 32-bit bands, each with its own
+# exact-match table: two hashes within Hamming distance 7 must share at
+# least one band (pigeonhole), so a lookup only checks a few candidates
+# instead of the whole folder. The index is saved as .phash_index.json and
+# only new or changed files are hashed when it is reopened.
+# ===============================
+INDEX_NAME = ".phash_index.json"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")
+INDEX_VERSION = 2
+HASH_SIZE = 16
+HASH_BITS = HASH_SIZE * HASH_SIZE
+BANDS = 8
+BAND_BITS = HASH_BITS // BANDS
+# Anything up to BANDS - 1 is found; stay well below the gap between problems
+MAX_DISTANCE = 4
+
+
+def dhash(image, hash_size=HASH_SIZE):
+    # Difference hash: is each pixel brighter than its right-hand neighbour?
+    if image.mode not in ("L", "RGB", "RGBA"):
+        image = image.convert("RGB")
+    small = image.resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR, reducing_gap=2.0)
+    pixels = np.asarray(small.convert("L"), dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def _bands(value):
+    mask = (1 << BAND_BITS) - 1
+    return [(value >> (band * BAND_BITS)) & mask for band in range(BANDS)]
+
+
+class PerceptualIndex:
+    def __init__(self, folder):
+        self.folder = folder
+        self.path = os.path.join(folder, INDEX_NAME)
+        # filename -> {"hash": int, "size": bytes or None, "mtime": ns or None}
+        self.entries = {}
+        self.tables = [dict() for _ in range(BANDS)]
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            # Older indexes hold 64-bit hashes: rehash everything
+            if data.get("version") == INDEX_VERSION:
+                for name, entry in data["entries"].items():
+                    self._insert(name, entry)
+        except (OSError, ValueError, AttributeError):
+            pass
+        self.sync()
+
+    def _insert(self, name, entry):
+        self.entries[name] = entry
+        for band, value in enumerate(_bands(entry["hash"])):
+            self.tables[band].setdefault(value, set()).add(name)
+
+    def _remove(self, name):
+        entry = self.entries.pop(name)
+        for band, value in enumerate(_bands(entry["hash"])):
+            names = self.tables[band].get(value)
+            if names:
+                names.discard(name)
+
+    def sync(self):
+        # Pick up files added, changed or deleted since the index was saved
+        on_disk = {}
+        for name in os.listdir(self.folder):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                stat = os.stat(os.path.join(self.folder, name))
+                on_disk[name] = (stat.st_size, stat.st_mtime_ns)
+
+        for name in [name for name in self.entries if name not in on_disk]:
+            entry = self.entries[name]
+            # Entries added for a write still in flight have no stat yet
+            if entry["mtime"] is not None:
+                self._remove(name)
+
+        for name, (size, mtime) in on_disk.items():
+            entry = self.entries.get(name)
+            if entry is not None and entry["mtime"] is None:
+                entry["size"], entry["mtime"] = size, mtime
+                continue
+            if entry is not None and entry["size"] == size and entry["mtime"] == mtime:
+                continue
+            try:
+                with Image.open(os.path.join(self.folder, name)) as image:
+                    image.draft("RGB", (64, 64))  # JPEG: decode at 1/8 scale
+                    value = dhash(image)
+            except OSError:
+                continue
+            if entry is not None:
+                self._remove(name)
+            self._insert(name, {"hash": value, "size": size, "mtime": mtime})
+
+    def find(self, value, max_distance=MAX_DISTANCE):
+        # Closest indexed filename within max_distance bits, or None
+        candidates = set()
+        for band, band_value in enumerate(_bands(value)):
+            candidates |= self.tables[band].get(band_value, set())
+        best = None
+        for name in candidates:
+            distance = hamming(value, self.entries[name]["hash"])
+            if distance <= max_distance and (best is None or distance < best[0]):
+                best = (distance, name)
+        return best[1] if best else None
+
+    def add(self, name, value):
+        # Register a file once it has been written to the folder
+        try:
+            stat = os.stat(os.path.join(self.folder, name))
+            size, mtime = stat.st_size, stat.st_mtime_ns
+        except OSError:
+            size = mtime = None  # not on disk (yet): kept in memory, never saved
+        if name in self.entries:
+            self._remove(name)
+        self._insert(name, {"hash": value, "size": size, "mtime": mtime})
+
+    def save(self):
+        # Pending entries are left out: if their write never lands they'd be
+        # stale, and if it does the next sync hashes the file anyway
+        entries = {name: entry for name, entry in self.entries.items() if entry["mtime"] is not None}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "entries": entries}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,50 @@
+import numpy as np
+from PIL import Image
+
+# ===============================
+# One canonical pixel buffer per pasted screenshot
+#
+# The pixels live once, in an HxWx4 RGBA uint8 array. Pillow gets a
+# zero-copy read-only view of it (Image.frombuffer maps RGBA memory
+# directly), NumPy/OpenCV get the array itself or its [..., :3] RGB view,
+# and a BGR copy is only made if someone asks for it - once.
+# ===============================
+ROWS_PER_CHUNK = 256
+
+
+class PixelBuffer:
+    def __init__(self, rgba):
+        if rgba.ndim != 3 or rgba.shape[2] != 4 or rgba.dtype != np.uint8:
+            raise ValueError("PixelBuffer expects an HxWx4 uint8 array")
+        self.rgba = np.ascontiguousarray(rgba)
+        height, width = self.rgba.shape[:2]
+        self.size = (width, height)
+        self.image = Image.frombuffer("RGBA", self.size, self.rgba, "raw", "RGBA", 0, 1)
+        self._bgr = None
+
+    @classmethod
+    def from_image(cls, image):
+        # Convert in row chunks straight into the final array, so there is never
+        # a second full-size RGBA copy next to the source image
+        width, height = image.size
+        rgba = np.empty((height, width, 4), dtype=np.uint8)
+        for top in range(0, height, ROWS_PER_CHUNK):
+            bottom = min(height, top + ROWS_PER_CHUNK)
+            rgba[top:bottom] = np.asarray(image.crop((0, top, width, bottom)).convert("RGBA"))
+        return cls(rgba)
+
+    @property
+    def rgb(self):
+        # Zero-copy (strided) RGB view
+        return self.rgba[..., :3]
+
+    @property
+    def bgr(self):
+        if self._bgr is None:
+            import cv2
+            self._bgr = cv2.cvtColor(self.rgba, cv2.COLOR_RGBA2BGR)
+        return self._bgr
+
+    @property
+    def nbytes(self):
+        return self.rgba.nbytes + (self._bgr.nbytes if self._bgr is not None else 0)
@@ -0,0 +1,136 @@
+import tkinter as tk
+from collections import OrderedDict
+from PIL import Image, ImageTk
+
+# ===============================
+# Virtualized preview list for ImageResizerApp
+#
+# Rows are plain data (captions + image sources). Only rows inside the
+# viewport get canvas items and PhotoImages; scrolling a row out of view
+# drops them, scrolling back rebuilds them from a bounded LRU of
+# preview-sized thumbnails. Memory stays flat however many images are loaded.
+# ===============================
+THUMB_SIZE = 360
+ROW_HEIGHT = THUMB_SIZE + 50
+COLUMN_WIDTH = THUMB_SIZE + 40
+
+
+def make_thumbnail(image, size=THUMB_SIZE):
+    # Safe on worker threads (pure Pillow). Resizes straight from the source
+    # rather than copy() + thumbnail(), so a 5K screenshot is never duplicated
+    width, height = image.size
+    scale = size / max(width, height)
+    if scale >= 1:
+        return image.copy()
+    return image.resize((max(1, round(width * scale)), max(1, round(height * scale))),
+                        Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+class ThumbnailCache:
+    def __init__(self, capacity=96):
+        self.capacity = capacity
+        self._items = OrderedDict()
+
+    def get(self, key, factory):
+        if key in self._items:
+            self._items.move_to_end(key)
+            return self._items[key]
+        thumb = factory()
+        self.put(key, thumb)
+        return thumb
+
+    def put(self, key, thumb):
+        self._items[key] = thumb
+        self._items.move_to_end(key)
+        while len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+class PreviewList(tk.Frame):
+    def __init__(self, master, cache_size=96, **kwargs):
+        super().__init__(master, **kwargs)
+        self.canvas = tk.Canvas(self, highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas.bind("<Configure>", lambda e: self.refresh())
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+
+        self.cache = ThumbnailCache(cache_size)
+        # Each row: {"id", "captions", "sources"}; sources are callables -> PIL image
+        self.rows = []
+        # row id -> (canvas item ids, PhotoImage refs) for rows currently on screen
+        self.live = {}
+        self._next_id = 0
+
+    def add_row(self, captions, sources, thumbnails=None):
+        # thumbnails (optional) are ready-made previews, e.g. from a worker thread
+        row = {"id": self._next_id, "captions": captions, "sources": sources}
+        self._next_id += 1
+        self.rows.append(row)
+        for column, thumb in enumerate(thumbnails or []):
+            if thumb is not None:
+                self.cache.put((row["id"], column), thumb)
+        self._update_scrollregion()
+        self.refresh()
+        return row["id"]
+
+    def clear(self):
+        for row_id in list(self.live):
+            self._drop_row(row_id)
+        self.rows = []
+        self.cache.clear()
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+
+    def _update_scrollregion(self):
+        width = max((len(row["sources"]) for row in self.rows), default=1) * COLUMN_WIDTH
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.rows) * ROW_HEIGHT))
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(int(-event.delta / 120), "units")
+
+    def refresh(self):
+        if not self.rows:
+            return
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        # One extra row either side so scrolling doesn't show blanks
+        first = max(0, int(top // ROW_HEIGHT) - 1)
+        last = min(len(self.rows), int(bottom // ROW_HEIGHT) + 2)
+        visible = {row["id"] for row in self.rows[first:last]}
+
+        for row_id in list(self.live):
+            if row_id not in visible:
+                self._drop_row(row_id)
+        for index in range(first, last):
+            if self.rows[index]["id"] not in self.live:
+                self._build_row(index)
+
+    def _build_row(self, index):
+        row = self.rows[index]
+        y = index * ROW_HEIGHT
+        items, photos = [], []
+        for column, (caption, source) in enumerate(zip(row["captions"], row["sources"])):
+            x = column * COLUMN_WIDTH + 20
+            thumb = self.cache.get((row["id"], column), lambda source=source: make_thumbnail(source()))
+            photo = ImageTk.PhotoImage(thumb)
+            photos.append(photo)
+            items.append(self.canvas.create_text(x, y + 10, text=caption, anchor="nw"))
+            items.append(self.canvas.create_image(x, y + 35, image=photo, anchor="nw"))
+        self.live[row["id"]] = (items, photos)
+
+    def _drop_row(self, row_id):
+        items, _ = self.live.pop(row_id)
+        for item in items:
+            self.canvas.delete(item)
@@ -0,0 +1,76 @@
+from PIL import Image
+
+from square_fit import square_fit_image
+from tracing import span
+
+# ===============================
+# Lazy resize recipes for ImageResizerApp
+#
+# A recipe is "this source, optionally cropped, squared like this" - nothing
+# is resampled until someone asks. Previews are made from a preview-sized
+# decode of the source; the full-resolution square is only built by render(),
+# which download/export calls one image at a time.
+# ===============================
+
+
+class ResizeRecipe:
+    def __init__(self, source, crop_box=None, mode="stretch"):
+        # source: a file path, or a PIL image already in memory (screenshots)
+        self.source = source
+        self.crop_box = crop_box
+        self.mode = mode
+
+    def _open(self, max_size=None):
+        if isinstance(self.source, Image.Image):
+            image = self.source
+        else:
+            image = Image.open(self.source)
+            if max_size and self.crop_box is None:
+                # JPEG can decode straight at 1/2-1/8 scale for previews
+                image.draft(image.mode, (max_size, max_size))
+        if self.crop_box is not None:
+            image = image.crop(self.crop_box)
+        return image
+
+    @property
+    def source_size(self):
+        if self.crop_box is not None:
+            x1, y1, x2, y2 = self.crop_box
+            return x2 - x1, y2 - y1
+        if isinstance(self.source, Image.Image):
+            return self.source.size
+        with Image.open(self.source) as image:  # header only, no pixel decode
+            return image.size
+
+    @property
+    def size(self):
+        side = max(self.source_size)
+        return side, side
+
+    def source_preview(self, max_size):
+        image = self._open(max_size)
+        width, height = image.size
+        scale = max_size / max(width, height)
+        if scale >= 1:
+            return image.copy()
+        # resize() straight from the source, no full-size copy first
+        return image.resize((max(1, round(width * scale)), max(1, round(height * scale))),
+                            Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    def previews(self, max_size):
+        # (source preview, squared preview) from a single preview-sized decode;
+        # squaring the small source is far cheaper than thumbnailing a full render
+        with span("decode", preview=max_size):
+            small = self.source_preview(max_size)
+        with span("resize", preview=max_size):
+            return small, square_fit_image(small, max(small.size), mode=self.mode)
+
+    def preview(self, max_size):
+        return self.previews(max_size)[1]
+
+    def render(self):
+        with span("decode"):
+            image = self._open()
+            image.load()
+        with span("resize", size=max(image.size)):
+            return square_fit_image(image, max(image.size), mode=self.mode)
@@ -0,0 +1,46 @@
+import os
+import json
+import time
+from datetime import datetime, timezone
+
+# ===============================
+# On-disk cache of daily challenge API responses
+#
+# One JSON file per challenge date under .cache/daily. LeetCode rolls the
+# daily problem over at 00:00 UTC, so the key is today's UTC date and a
+# rerun on the same day is served from disk without touching the network.
+# ===============================
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "daily")
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+
+def challenge_date():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+class DailyChallengeCache:
+    def __init__(self, cache_dir=CACHE_DIR, ttl=DEFAULT_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("fetched_at", 0) > self.ttl:
+            return None
+        return entry["response"]
+
+    def put(self, key, response):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "response": response}, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,135 @@
+from functools import lru_cache
+from PIL import Image
+
+# ===============================
+# Shared square-fit engine (NumPy in, NumPy out)
+#
+#   "pad"     - keep aspect ratio, letterbox onto a solid background
+#   "stretch" - ignore aspect ratio, fill the square
+#   "crop"    - keep aspect ratio, fill the square and center-crop the excess
+#
+# The output square is allocated once and the resample writes straight into
+# its target window, so there is no separate resized copy to paste.
+#
+# NumPy and OpenCV are imported on the first resample, not at import time:
+# together they cost over 100 ms of start-up for every entry point.
+# ===============================
+MODES = ("pad", "stretch", "crop")
+
+
+@lru_cache(maxsize=None)
+def _cv2():
+    try:
+        import cv2
+    except ImportError:  # OpenCV is optional, Pillow does the resample without it
+        return None
+    return cv2
+
+
+def has_cv2():
+    # True when resampling goes through OpenCV rather than the Pillow fallback
+    return _cv2() is not None
+
+
+def _resample_into(pixels, out, new_w, new_h):
+    shrinking = new_w <= pixels.shape[1] and new_h <= pixels.shape[0]
+    cv2 = _cv2()
+    if cv2 is not None:
+        # INTER_AREA is a proper box filter when shrinking; Lanczos when growing
+        interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4
+        result = cv2.resize(pixels, (new_w, new_h), dst=out, interpolation=interpolation)
+        if result is not out:
+            out[...] = result
+        return
+
+    image = Image.fromarray(pixels)
+    if shrinking:
+        resized = image.resize((new_w, new_h), Image.Resampling.BICUBIC, reducing_gap=2.0)
+    else:
+        resized = image.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    import numpy as np
+    out[...] = np.asarray(resized)
+
+
+def square_fit(pixels, size, mode="pad", background=(255, 255, 255)):
+    # pixels: HxW or HxWxC uint8 array. Returns a new size x size array.
+    import numpy as np
+    if mode not in MODES:
+        raise ValueError(f"Unknown square-fit mode: {mode} (expected one of {', '.join(MODES)})")
+
+    height, width = pixels.shape[:2]
+    out = np.empty((size, size) + pixels.shape[2:], dtype=np.uint8)
+
+    if mode == "stretch":
+        _resample_into(pixels, out, size, size)
+        return out
+
+    if mode == "crop":
+        # Crop the source to a centered square first, then resample once
+        side = min(width, height)
+        x0, y0 = (width - side) // 2, (height - side) // 2
+        _resample_into(np.ascontiguousarray(pixels[y0:y0 + side, x0:x0 + side]), out, size, size)
+        return out
+
+    ratio = min(size / width, size / height)
+    new_w, new_h = max(1, int(width * ratio)), max(1, int(height * ratio))
+    x0, y0 = (size - new_w) // 2, (size - new_h) // 2
+
+    # Only the letterbox bars need the background colour
+    fill = background[:out.shape[2]] if out.ndim == 3 else background[0]
+    out[:y0] = fill
+    out[y0 + new_h:] = fill
+    out[y0:y0 + new_h, :x0] = fill
+    out[y0:y0 + new_h, x0 + new_w:] = fill
+    _resample_into(pixels, out[y0:y0 + new_h, x0:x0 + new_w], new_w, new_h)
+    return out
+
+
+def _reduce_factor(source, target):
+    # Largest integer reduce() factor that keeps both axes at least the target
+    # size; reduce() box-averages, so reduce + area resample is still area
+    # averaging overall
+    return max(1, int(min(source[0] / target[0], source[1] / target[1])))
+
+
+def square_fit_image(image, size, mode="pad", background=(255, 255, 255)):
+    # Pillow convenience wrapper; palette/CMYK/etc. are normalised first.
+    # Enlarging stays in Pillow (Lanczos, no NumPy copies); shrinking is
+    # reduce()d in Pillow first, so only a small frame is handed to NumPy
+    if mode not in MODES:
+        raise ValueError(f"Unknown square-fit mode: {mode} (expected one of {', '.join(MODES)})")
+    if image.mode not in ("RGB", "RGBA", "L"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+    if mode == "pad" and image.mode == "RGBA":
+        background = tuple(background[:3]) + (255,)
+
+    width, height = image.size
+    box = (0, 0, width, height)
+    if mode == "crop":
+        side = min(width, height)
+        x0, y0 = (width - side) // 2, (height - side) // 2
+        box = (x0, y0, x0 + side, y0 + side)
+    if mode == "pad":
+        ratio = min(size / width, size / height)
+        target = (max(1, int(width * ratio)), max(1, int(height * ratio)))
+    else:
+        target = (size, size)
+    box_size = (box[2] - box[0], box[3] - box[1])
+
+    if target[0] > box_size[0] or target[1] > box_size[1]:
+        # A stretch to the longest side always grows one axis
+        resized = image.resize(target, Image.Resampling.LANCZOS, box=box)
+        if mode != "pad":
+            return resized
+        fill = background[0] if image.mode == "L" else tuple(background[:len(image.mode)])
+        out = Image.new(image.mode, (size, size), fill)
+        out.paste(resized, ((size - target[0]) // 2, (size - target[1]) // 2))
+        return out
+
+    factor = _reduce_factor(box_size, target)
+    if factor > 1:
+        image = image.reduce(factor, box=box)
+    elif mode == "crop":
+        image = image.crop(box)
+    import numpy as np
+    return Image.fromarray(square_fit(np.asarray(image), size, mode, background))
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import output_profiles
+from exporter import write_atomic
+
+# ===============================
+# Output path/format negotiation (output_profiles.resolve)
+#
+#   python -m pytest tests
+# ===============================
+PROFILES = sorted(name for name, settings in output_profiles.PROFILES.items() if "format" not in settings)
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+@pytest.mark.parametrize("path, fmt", [
+    ("shot.png", "PNG"),
+    ("shot.jpg", "JPEG"),
+    ("shot.JPEG", "JPEG"),
+    ("shot.webp", "WEBP"),
+    ("shot.gif", "GIF"),
+    ("shot.bmp", "BMP"),
+    ("shot.tiff", "TIFF"),
+])
+def test_keeps_source_format_and_extension(profile, path, fmt):
+    assert output_profiles.resolve(path, profile) == (fmt, path)
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_unknown_extension_becomes_png(profile):
+    assert output_profiles.resolve("shot.xyz", profile) == ("PNG", "shot.png")
+    assert output_profiles.resolve("shot", profile) == ("PNG", "shot.png")
+
+
+@pytest.mark.parametrize("path", ["shot.png", "shot.jpg", "shot.gif", "shot.bmp"])
+def test_forced_format_renames(path):
+    assert output_profiles.resolve(path, "webp") == ("WEBP", "shot.webp")
+
+
+@pytest.mark.parametrize("ext, fmt", [(".gif", "GIF"), (".bmp", "BMP")])
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "P"])
+def test_export_writes_source_format(tmp_path, ext, fmt, mode):
+    requested = str(tmp_path / f"shot_resized{ext}")
+    path, size = write_atomic(Image.new(mode, (32, 32)), requested, "default")
+    assert path == requested and size > 0
+    with Image.open(path) as image:
+        assert image.format == fmt
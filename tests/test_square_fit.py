@@ -0,0 +1,85 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+import square_fit
+# Pillow reference paths and the synthetic screenshot live with the benchmark
+from bench_square_fit import REFERENCES, MAX_MEAN_DIFF, make_screenshot
+
+# ===============================
+# Pixel-diff tests: square_fit engine vs the Pillow paths it replaced
+#
+#   python -m pytest tests
+#
+# Resampling filters differ at hard edges, so single pixels may be off by a
+# few dozen levels; the mean difference must stay under MAX_MEAN_DIFF.
+# ===============================
+TARGET = 1080
+MAX_PIXEL_DIFF = 32  # out of 255
+# square_fit_image box-reduces large frames in Pillow first, so text edges
+# can land a little further from the bicubic reference
+MAX_IMAGE_PIXEL_DIFF = 64
+SIZES = [(1280, 720), (2560, 1440), (3840, 2160), (1170, 2532), (640, 360)]
+
+
+@pytest.fixture(params=["opencv", "pillow"])
+def backend(request, monkeypatch):
+    if request.param == "opencv":
+        if not square_fit.has_cv2():
+            pytest.skip("OpenCV is not installed")
+    else:
+        monkeypatch.setattr(square_fit, "_cv2", lambda: None)
+    return request.param
+
+
+@pytest.mark.parametrize("mode", sorted(REFERENCES))
+@pytest.mark.parametrize("size", SIZES, ids=lambda size: f"{size[0]}x{size[1]}")
+def test_matches_pillow(backend, mode, size):
+    image = make_screenshot(size)
+    expected = np.asarray(REFERENCES[mode](image, TARGET), dtype=np.int16)
+    actual = square_fit.square_fit(np.asarray(image), TARGET, mode)
+
+    assert actual.shape == expected.shape
+    diff = np.abs(expected - actual.astype(np.int16))
+    assert diff.mean() <= MAX_MEAN_DIFF
+    assert diff.max() <= MAX_PIXEL_DIFF
+
+
+@pytest.mark.parametrize("mode", sorted(REFERENCES))
+@pytest.mark.parametrize("size", SIZES + [(5120, 2880)], ids=lambda size: f"{size[0]}x{size[1]}")
+def test_image_wrapper_matches_pillow(backend, mode, size):
+    image = make_screenshot(size)
+    expected = np.asarray(REFERENCES[mode](image, TARGET), dtype=np.int16)
+    actual = square_fit.square_fit_image(image, TARGET, mode)
+
+    assert actual.size == (TARGET, TARGET)
+    diff = np.abs(expected - np.asarray(actual, dtype=np.int16))
+    assert diff.mean() <= MAX_MEAN_DIFF
+    assert diff.max() <= MAX_IMAGE_PIXEL_DIFF
+
+
+def test_enlarging_stretch_is_plain_lanczos():
+    # resize_image / ResizeRecipe stretch to the longest side, which always
+    # enlarges one axis: that must stay a single Pillow resize
+    image = make_screenshot((1920, 1080))
+    expected = image.resize((1920, 1920), Image.Resampling.LANCZOS)
+    assert np.array_equal(np.asarray(square_fit.square_fit_image(image, 1920, "stretch")), np.asarray(expected))
+
+
+def test_pad_fills_letterbox_with_background():
+    pixels = np.asarray(make_screenshot((1920, 1080)))
+    out = square_fit.square_fit(pixels, TARGET, "pad", background=(10, 20, 30))
+    top = (TARGET - TARGET * 1080 // 1920) // 2
+    assert (out[:top] == (10, 20, 30)).all()
+    assert (out[-top:] == (10, 20, 30)).all()
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        square_fit.square_fit(np.zeros((10, 10, 3), dtype=np.uint8), 8, "zoom")
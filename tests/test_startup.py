@@ -0,0 +1,19 @@
+import os
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ===============================
+# Import-time budgets (benchmarks/check_startup.py) as part of the suite
+#
+#   python -m pytest tests
+#   INSTABOT_STARTUP_SCALE=2 python -m pytest tests   # slow CI box
+# ===============================
+
+
+def test_entry_points_within_startup_budget():
+    scale = os.environ.get("INSTABOT_STARTUP_SCALE", "1")
+    result = subprocess.run([sys.executable, os.path.join(ROOT, "benchmarks", "check_startup.py"), "--scale", scale],
+                            cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
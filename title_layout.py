@@ -0,0 +1,319 @@
+import os
+import json
+import hashlib
+from functools import lru_cache
+import PIL
+from PIL import Image, ImageDraw, ImageFont
+
+import fonts
+import backgrounds
+from tracing import span
+
+# ===============================
+# Template-driven title card layout
+#
+# A template (templates/*.json) is a card size, a background and a list of
+# text boxes:
+#
+#   {"text": "{problem}", "font": ["text"], "size": 45, "min_size": 30,
+#    "max_lines": 2, "box": [x, y, width, height], "align": "center",
+#    "valign": "top", "fill": [255, 255, 255],
+#    "append": {"text": "⭐", "font": ["emoji", "title"], "gap": 15, "fill": [...]}}
+#
+# "text" is a str.format pattern over the card values (problem, difficulty,
+# tags, date). "font" is a fallback list of FONT_CHAINS names; Pillow's
+# built-in scalable font is the last resort. Each box gets the largest size
+# in [min_size, size] whose word-wrapped text fits the box in max_lines
+# lines; if even min_size doesn't fit, the last line ends in "…" instead of
+# words silently going missing.
+#
+# Measuring never touches the target image: glyph advances are read once per
+# font at REFERENCE_SIZE and scaled, so the size search is arithmetic. The
+# finished layout (sizes + positions, no colours or background) is cached by
+# a hash of its inputs - including the font files the chains resolved to -
+# in memory and in .cache/layouts, so re-theming cards never measures text
+# again.
+# ===============================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
+CACHE_DIR = os.path.join(BASE_DIR, ".cache", "layouts")
+LAYOUT_VERSION = 1
+REFERENCE_SIZE = 100
+ELLIPSIS = "…"
+
+DAILY_TEMPLATE = "daily_title"
+POST_TEMPLATE = "post_title"
+
+FONT_CHAINS = {
+    "title": fonts.TITLE_FONTS,
+    "text": fonts.TEXT_FONTS,
+    "emoji": fonts.EMOJI_FONTS,
+    "arial": ("arial.ttf",),
+    "arial_bold": ("arialbd.ttf",),
+}
+
+_layouts = {}
+
+
+def template_path(name):
+    # name: a file in templates/ (without .json) or a path to a JSON file
+    return name if name.endswith(".json") else os.path.join(TEMPLATES_DIR, f"{name}.json")
+
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    with open(template_path(name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def resolve_chain(font_names):
+    # First FONT_CHAINS entry that loads -> its name, or "default"
+    for name in font_names:
+        try:
+            fonts.resolve_font(FONT_CHAINS[name], REFERENCE_SIZE)
+            return name
+        except OSError:
+            continue
+    return "default"
+
+
+@lru_cache(maxsize=None)
+def font_identity(chain):
+    # The font file a chain actually resolved to, for cache keys: a fallback
+    # font lays out differently from the preferred one
+    if chain == "default":
+        return ["default", PIL.__version__]
+    path = load_font(chain, REFERENCE_SIZE).path
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:  # bare name found on the system font path
+        mtime_ns = None
+    return [path, mtime_ns]
+
+
+@lru_cache(maxsize=None)
+def load_font(chain, size):
+    if chain == "default":
+        return ImageFont.load_default(size)
+    return fonts.resolve_font(FONT_CHAINS[chain], size)
+
+
+class FontMetrics:
+    # Per-font glyph advances and line metrics at REFERENCE_SIZE; a size-s
+    # width is the reference width scaled by s / REFERENCE_SIZE
+    def __init__(self, chain):
+        self.font = load_font(chain, REFERENCE_SIZE)
+        ascent, descent = self.font.getmetrics()
+        self.line_height = ascent + descent
+        self._advances = {}
+        self._words = {}
+
+    def advance(self, char):
+        width = self._advances.get(char)
+        if width is None:
+            width = self._advances[char] = self.font.getlength(char)
+        return width
+
+    def width(self, text, size):
+        width = self._words.get(text)
+        if width is None:
+            width = self._words[text] = sum(self.advance(char) for char in text)
+        return width * size / REFERENCE_SIZE
+
+
+@lru_cache(maxsize=None)
+def font_metrics(chain):
+    return FontMetrics(chain)
+
+
+def _wrap(words, metrics, size, width, max_lines):
+    # Greedy wrap; None if a word doesn't fit on a line or it needs too many lines
+    space = metrics.width(" ", size)
+    lines, current, current_width = [], [], 0.0
+    for word in words:
+        word_width = metrics.width(word, size)
+        if word_width > width:
+            return None
+        if current and current_width + space + word_width > width:
+            lines.append(current)
+            current, current_width = [], 0.0
+        current_width += (space if current else 0) + word_width
+        current.append(word)
+    if current:
+        lines.append(current)
+    if len(lines) > max_lines:
+        return None
+    return [" ".join(line) for line in lines]
+
+
+def _ellipsize(words, metrics, size, width, max_lines):
+    # min_size still doesn't fit: fill max_lines and mark the cut with "…"
+    lines, current = [], ""
+    for word in words:
+        candidate = f"{current} {word}" if current else word
+        if current and metrics.width(candidate, size) > width:
+            lines.append(current)
+            candidate = word
+        current = candidate
+    lines.append(current)
+
+    cut = len(lines) > max_lines
+    lines = lines[:max_lines]
+    for number, line in enumerate(lines):
+        if cut and number == len(lines) - 1 or metrics.width(line, size) > width:
+            while line and metrics.width(line + ELLIPSIS, size) > width:
+                line = line[:-1].rstrip()
+            lines[number] = line + ELLIPSIS
+    return lines
+
+
+def _fit(text, metrics, box, extra_width):
+    # Largest size in [min_size, size] that fits; binary search over sizes
+    width, height = box["box"][2] - extra_width, box["box"][3]
+    max_lines = box.get("max_lines", 1)
+    spacing = box.get("line_spacing", 1.15)
+    words = text.split()
+
+    def attempt(size):
+        lines = _wrap(words, metrics, size, width, max_lines)
+        if lines is None:
+            return None
+        block = metrics.line_height * size / REFERENCE_SIZE * (1 + spacing * (len(lines) - 1))
+        return lines if block <= height else None
+
+    low, high = box.get("min_size", box["size"]), box["size"]
+    best = attempt(low)
+    if best is None:
+        return low, _ellipsize(words, metrics, low, width, max_lines)
+    while low < high:
+        middle = (low + high + 1) // 2
+        lines = attempt(middle)
+        if lines is None:
+            high = middle - 1
+        else:
+            low, best = middle, lines
+    return low, best
+
+
+def _layout_box(index, box, text):
+    x, y, width, height = box["box"]
+    chain = resolve_chain(tuple(box["font"]))
+    metrics = font_metrics(chain)
+
+    append = box.get("append")
+    append_chain = resolve_chain(tuple(append["font"])) if append else None
+    extra_width = 0
+    if append:
+        extra_width = append.get("gap", 0) + font_metrics(append_chain).width(append["text"], box["size"])
+
+    size, lines = _fit(text, metrics, box, extra_width)
+
+    # Exact widths only for the lines actually drawn (kerning included)
+    font = load_font(chain, size)
+    line_height = metrics.line_height * size / REFERENCE_SIZE
+    step = line_height * box.get("line_spacing", 1.15)
+    block = line_height + step * (len(lines) - 1)
+    valign = box.get("valign", "top")
+    top = y if valign == "top" else y + (height - block) / (2 if valign == "middle" else 1)
+
+    ops = []
+    align = box.get("align", "left")
+    for number, line in enumerate(lines):
+        line_width = font.getlength(line)
+        is_last = number == len(lines) - 1
+        full_width = line_width + (extra_width * size / box["size"] if append and is_last else 0)
+        if align == "center":
+            left = x + (width - full_width) / 2
+        elif align == "right":
+            left = x + width - full_width
+        else:
+            left = x
+        line_top = top + step * number
+        ops.append({"box": index, "part": "text", "text": line, "font": chain, "size": size,
+                    "xy": [round(left), round(line_top)]})
+
+        if append and is_last:
+            append_metrics = font_metrics(append_chain)
+            # Centre the appended glyph on the line it follows
+            append_height = append_metrics.line_height * size / REFERENCE_SIZE
+            ops.append({"box": index, "part": "append", "text": append["text"], "font": append_chain,
+                        "size": size,
+                        "xy": [round(left + line_width + append.get("gap", 0) * size / box["size"]),
+                               round(line_top + (line_height - append_height) / 2)]})
+    return ops
+
+
+def _layout_key(template, texts):
+    chains = [resolve_chain(tuple(box["font"])) for box in template["boxes"]]
+    chains += [resolve_chain(tuple(box["append"]["font"])) for box in template["boxes"] if box.get("append")]
+    fonts_used = [font_identity(chain) for chain in chains]
+    # Colours and the background are not part of the key: they don't move text
+    geometry = [{key: value for key, value in box.items() if key not in ("fill", "text")}
+                for box in template["boxes"]]
+    for box in geometry:
+        if "append" in box:
+            box["append"] = {key: value for key, value in box["append"].items() if key != "fill"}
+    payload = json.dumps([LAYOUT_VERSION, template["size"], geometry, fonts_used, texts],
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def layout_card(template, values):
+    # Returns {"key", "ops"}; ops are the text draws in order, without colours
+    texts = [box["text"].format(**values) for box in template["boxes"]]
+    key = _layout_key(template, texts)
+    layout = _layouts.get(key)
+    if layout is not None:
+        return layout
+
+    cache_path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            layout = json.load(f)
+    except (OSError, ValueError):
+        with span("text_layout"):
+            ops = []
+            for index, (box, text) in enumerate(zip(template["boxes"], texts)):
+                ops.extend(_layout_box(index, box, text))
+        layout = {"key": key, "ops": ops}
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(layout, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+
+    _layouts[key] = layout
+    return layout
+
+
+def card_background(template, theme=None):
+    width, height = template["size"]
+    background = template.get("background", {})
+    if theme or "theme" in background:
+        return backgrounds.get_background(theme or background["theme"], width)
+    return Image.new("RGB", (width, height), tuple(background.get("color", (30, 30, 30))))
+
+
+def render_card(template, values, theme=None):
+    # template: a loaded template dict or a template name/path
+    if isinstance(template, str):
+        template = load_template(template)
+    layout = layout_card(template, values)
+    with span("composite", step="background"):
+        image = card_background(template, theme)
+    with span("composite", step="text"):
+        draw = ImageDraw.Draw(image)
+        for op in layout["ops"]:
+            box = template["boxes"][op["box"]]
+            fill = box["append"]["fill"] if op["part"] == "append" else box.get("fill", (255, 255, 255))
+            draw.text(tuple(op["xy"]), op["text"], font=load_font(op["font"], op["size"]), fill=tuple(fill))
+    return image
+
+
+def card_values(problem, difficulty, tags, on_date):
+    # problem: "1123. Title"; tags: list or "A, B" string; on_date: date/datetime
+    if not isinstance(tags, str):
+        tags = ", ".join(tags)
+    return {"problem": problem, "difficulty": difficulty, "tags": tags,
+            "date": on_date.strftime("%d/%m/%Y")}
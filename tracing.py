@@ -0,0 +1,119 @@
+import os
+import json
+import time
+import atexit
+import threading
+import functools
+
+# ===============================
+# Lightweight tracing for the image pipelines
+#
+#   with tracing.span("encode", format="PNG"):
+#       ...
+#
+#   @tracing.span("process_images")
+#   def process_images(...):
+#
+# Phases used across the tools: decode, resize, text_layout, composite,
+# encode, disk_write, network (plus one span per top-level entry point).
+# While disabled a span is one slotted object and a None check - nothing is
+# recorded. Enable it with INSTABOT_TRACE=trace.json (any entry point) or
+# --trace on the CLIs: the file is a Chrome trace (open it in
+# chrome://tracing or ui.perfetto.dev) and a per-phase summary is printed
+# when the process exits. ProcessPoolExecutor workers aren't traced, so use
+# --workers 1 to see everything from batch.py.
+# ===============================
+_events = None  # list of (name, start_ns, duration_ns, thread id, args) while enabled
+_path = None
+_origin = time.perf_counter_ns()
+
+
+def enable(path=None):
+    # path: where report() writes the Chrome trace (None = summary only)
+    global _events, _path
+    if _events is None:
+        _events = []
+        atexit.register(report)
+    _path = path
+
+
+def disable():
+    global _events
+    _events = None
+
+
+def enabled():
+    return _events is not None
+
+
+class span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        if _events is not None:
+            self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None and _events is not None:
+            end = time.perf_counter_ns()
+            _events.append((self.name, self.start, end - self.start, threading.get_ident(), self.args))
+        self.start = None
+
+    def __call__(self, func):
+        # Decorator: the enabled check happens per call, not at import time
+        name, args = self.name, self.args
+
+        @functools.wraps(func)
+        def wrapper(*a, **kw):
+            if _events is None:
+                return func(*a, **kw)
+            with span(name, **args):
+                return func(*a, **kw)
+        return wrapper
+
+
+def write_chrome_trace(path):
+    pid = os.getpid()
+    trace = {
+        "displayTimeUnit": "ms",
+        "traceEvents": [
+            {"name": name, "ph": "X", "pid": pid, "tid": tid,
+             "ts": (start - _origin) / 1000, "dur": duration / 1000,
+             "args": {key: str(value) for key, value in args.items()}}
+            for name, start, duration, tid, args in list(_events or [])
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace, f)
+    return path
+
+
+def summary():
+    totals = {}
+    for name, _, duration, _, _ in list(_events or []):
+        count, total, longest = totals.get(name, (0, 0, 0))
+        totals[name] = (count + 1, total + duration, max(longest, duration))
+
+    lines = [f"{'span':<24}{'count':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}"]
+    for name, (count, total, longest) in sorted(totals.items(), key=lambda item: -item[1][1]):
+        lines.append(f"{name:<24}{count:>7}{total / 1e6:>11.1f}{total / count / 1e6:>10.2f}{longest / 1e6:>10.2f}")
+    return "\n".join(lines)
+
+
+def report():
+    if not _events:
+        return
+    print("\n⏱️ Trace summary")
+    print(summary())
+    if _path:
+        print(f"Chrome trace written to: {write_chrome_trace(_path)}")
+
+
+if os.environ.get("INSTABOT_TRACE"):
+    enable(os.environ["INSTABOT_TRACE"])
@@ -0,0 +1,299 @@
+import os
+import re
+import sys
+import json
+import time
+import queue
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # polling fallback
+    Observer = None
+    FileSystemEventHandler = object
+
+import batch
+import output_profiles
+
+# ===============================
+# Watch-folder daemon: screenshots in, finished post folders out
+#
+#   python watcher.py inbox --out posts
+#
+# Pairing: "<key>_problem.png" + "<key>_solution.png" (also "-" or no
+# separator; png, jpg, webp, bmp or gif). Screenshots without a role in the name are
+# paired by time: the two oldest, within --pair-window seconds, become
+# problem + solution.
+#
+# Metadata: "<key>.json" next to the screenshots
+# ({"problem_name", "difficulty", "tags"}), otherwise today's daily
+# challenge (cached per day, see leetcode_daily.py). A numeric key has to
+# match the daily problem's number; pairs without metadata wait until a
+# sidecar appears. A sidecar is read once it has settled like the
+# screenshots; one that doesn't parse is reported and its pair waits until
+# the file is fixed.
+#
+# Files count as written once their size and mtime have been stable for
+# --settle seconds. Events come from watchdog (inotify & co.) when it is
+# installed, with a periodic rescan as a safety net; otherwise the folder is
+# polled. Posts render on a long-lived process pool (no interpreter start-up
+# per job). Finished pairs are recorded in <out>/.watch_state.json, so a
+# restart skips what is done and redoes only what was in flight.
+# ===============================
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif")
+SIDECAR_EXTENSION = ".json"
+ROLE_PATTERN = re.compile(r"^(?P<key>.*?)[-_ ]?(?P<role>problem|solution)$", re.IGNORECASE)
+STATE_NAME = ".watch_state.json"
+RESCAN_SECONDS = 10.0
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, events):
+        self.events = events
+
+    def on_any_event(self, event):
+        if not event.is_directory:
+            self.events.put(getattr(event, "dest_path", None) or event.src_path)
+
+
+def _warm_up(_):
+    # Runs once per worker so the first real job doesn't pay for imports
+    import main  # noqa: F401
+    return os.getpid()
+
+
+def file_key(path, stat):
+    return f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+class WatchFolder:
+    def __init__(self, inbox, output_root, workers=None, profile=None, settle=0.3, poll=0.25,
+                 pair_window=300.0, metadata_source=None):
+        self.inbox = inbox
+        self.output_root = output_root
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.profile = profile
+        self.settle = settle
+        self.poll = poll
+        self.pair_window = pair_window
+        # metadata_source(key) -> dict or None; defaults to sidecar JSON + daily challenge
+        self.metadata_source = metadata_source or self.default_metadata
+
+        # path -> [size, mtime_ns, monotonic time it last changed]
+        self.pending = {}
+        # file keys of screenshots that are rendering or done
+        self.claimed = set()
+        self.futures = {}
+        self.events = queue.Queue()
+        self._daily = None
+        # (path, size, mtime_ns) of sidecars already reported as unreadable
+        self._bad_sidecars = set()
+
+        self.state_path = os.path.join(output_root, STATE_NAME)
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            self.state = {"done": {}}
+        for pair_key in self.state["done"]:
+            self.claimed.update(pair_key.split("||"))
+
+    # ---------- discovery ----------
+    def scan(self):
+        seen = set()
+        with os.scandir(self.inbox) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    seen.add(entry.path)
+                    self.touch(entry.path)
+        # Files that vanished without an event (polling mode)
+        for path in [path for path in self.pending if path not in seen]:
+            del self.pending[path]
+
+    def touch(self, path):
+        # Screenshots and metadata sidecars both go through the settle timer
+        if not path.lower().endswith(IMAGE_EXTENSIONS + (SIDECAR_EXTENSION,)):
+            return
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.pending.pop(path, None)  # deleted or renamed away
+            return
+        if file_key(path, stat) in self.claimed:
+            return
+        known = self.pending.get(path)
+        if known is None or known[0] != stat.st_size or known[1] != stat.st_mtime_ns:
+            # New or still being written: restart its settle timer
+            self.pending[path] = [stat.st_size, stat.st_mtime_ns, time.monotonic()]
+
+    def settled(self, path):
+        size, _, changed = self.pending[path]
+        return size > 0 and time.monotonic() - changed >= self.settle
+
+    def ready_images(self):
+        return [path for path in self.pending
+                if path.lower().endswith(IMAGE_EXTENSIONS) and self.settled(path)]
+
+    # ---------- pairing ----------
+    def pairs(self, ready):
+        by_key, loose = {}, []
+        for path in ready:
+            match = ROLE_PATTERN.match(os.path.splitext(os.path.basename(path))[0])
+            if match:
+                by_key.setdefault(match.group("key"), {})[match.group("role").lower()] = path
+            else:
+                loose.append(path)
+
+        found = [(key, roles["problem"], roles["solution"])
+                 for key, roles in by_key.items() if "problem" in roles and "solution" in roles]
+
+        # No naming convention: oldest two screenshots, close enough in time
+        loose.sort(key=lambda path: self.pending[path][1])
+        while len(loose) >= 2:
+            first, second = loose[0], loose[1]
+            if (self.pending[second][1] - self.pending[first][1]) / 1e9 > self.pair_window:
+                loose.pop(0)  # too far apart; wait for its partner
+                continue
+            found.append(("", first, second))
+            loose = loose[2:]
+        return found
+
+    # ---------- metadata ----------
+    def default_metadata(self, key):
+        sidecar = os.path.join(self.inbox, key + SIDECAR_EXTENSION)
+        if key and os.path.exists(sidecar):
+            if sidecar not in self.pending:
+                self.touch(sidecar)  # no event seen for it yet
+            if sidecar not in self.pending or not self.settled(sidecar):
+                return None  # still being written
+            try:
+                with open(sidecar, encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("expected a JSON object")
+                tags = data.get("tags", "")
+                return {"problem_name": data["problem_name"], "difficulty": data["difficulty"],
+                        "tags": tags if isinstance(tags, str) else ", ".join(tags)}
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                version = (sidecar, *self.pending[sidecar][:2])
+                if version not in self._bad_sidecars:
+                    self._bad_sidecars.add(version)
+                    print(f"⚠️ Can't read {os.path.basename(sidecar)} ({e!r}); waiting for a fixed version")
+                return None
+
+        daily = self.daily_challenge()
+        if daily and (not key.isdigit() or key == str(daily["number"])):
+            return {"problem_name": f"{daily['number']}. {daily['title']}", "difficulty": daily["difficulty"],
+                    "tags": ", ".join(daily["tags"])}
+        return None
+
+    def daily_challenge(self):
+        # Cached per day on disk, so this is one request per day; failures
+        # are retried at most once a minute
+        from response_cache import challenge_date
+        today = challenge_date()
+        if self._daily is not None:
+            day, problem_info, fetched_at = self._daily
+            if day == today and (problem_info or time.monotonic() - fetched_at < 60):
+                return problem_info
+        from leetcode_daily import LeetCodeDaily
+        leetcode = LeetCodeDaily()
+        try:
+            self._daily = (today, leetcode.get_daily_challenge(), time.monotonic())
+        finally:
+            leetcode.cleanup()
+        return self._daily[1]
+
+    # ---------- rendering ----------
+    def submit_ready(self, pool):
+        for key, problem, solution in self.pairs(self.ready_images()):
+            metadata = self.metadata_source(key)
+            if metadata is None:
+                continue  # retried on the next pass, e.g. once <key>.json lands
+            try:
+                keys = [file_key(path, os.stat(path)) for path in (problem, solution)]
+            except OSError:
+                continue  # gone since the last scan
+            for path in (problem, solution):
+                self.pending.pop(path, None)
+            self.claimed.update(keys)
+            item = dict(metadata, problem_image=problem, solution_image=solution, date=None)
+            future = pool.submit(batch.render_item, item, self.output_root, self.profile)
+            self.futures[future] = ("||".join(keys), item)
+            print(f"📥 {os.path.basename(problem)} + {os.path.basename(solution)} → {metadata['problem_name']}")
+
+    def collect_done(self):
+        for future in [future for future in self.futures if future.done()]:
+            pair_key, item = self.futures.pop(future)
+            try:
+                folder, elapsed = future.result()
+            except Exception as e:
+                # Release the screenshots so a fixed/replaced file is picked up again
+                self.claimed.difference_update(pair_key.split("||"))
+                print(f"❌ {item['problem_name']}: {e}")
+                continue
+            self.state["done"][pair_key] = folder
+            self.save_state()
+            print(f"✅ {item['problem_name']} → {folder} ({elapsed:.2f}s)")
+
+    def save_state(self):
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def run(self):
+        os.makedirs(self.output_root, exist_ok=True)
+        observer = None
+        if Observer is not None:
+            observer = Observer()
+            observer.schedule(_EventHandler(self.events), self.inbox, recursive=False)
+            observer.start()
+        mode = "watchdog" if observer else f"polling every {self.poll}s"
+        print(f"👀 Watching {self.inbox} ({mode}) → {self.output_root}, {self.workers} workers")
+
+        last_scan = 0.0
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(_warm_up, range(self.workers)))
+                while True:
+                    try:
+                        self.touch(self.events.get(timeout=self.poll))
+                        while True:
+                            self.touch(self.events.get_nowait())
+                    except queue.Empty:
+                        pass
+                    # Polling mode scans every pass; with events, now and then
+                    if observer is None or time.monotonic() - last_scan >= RESCAN_SECONDS:
+                        self.scan()
+                        last_scan = time.monotonic()
+                    self.submit_ready(pool)
+                    self.collect_done()
+        except KeyboardInterrupt:
+            print("\n👋 Stopping watcher")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Turn screenshots dropped into a folder into post folders")
+    parser.add_argument("inbox", help="Folder the problem/solution screenshots are saved into")
+    parser.add_argument("--out", default=".", help="Folder to write Leetcode_<date>_<id> post folders into")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: cores - 1)")
+    parser.add_argument("--profile", choices=sorted(output_profiles.PROFILES), help="Encoder preset for saved images")
+    parser.add_argument("--settle", type=float, default=0.3, help="Seconds a file must stay unchanged before it's used")
+    parser.add_argument("--poll", type=float, default=0.25, help="Polling interval / event wait in seconds")
+    parser.add_argument("--pair-window", type=float, default=300.0,
+                        help="Max seconds between two unnamed screenshots that get paired")
+    args = parser.parse_args(argv)
+
+    WatchFolder(args.inbox, args.out, args.workers, args.profile, args.settle, args.poll, args.pair_window).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())